@@ -1,8 +1,7 @@
-from goldenverba.components.interfaces import Chunker
-from goldenverba.components.document import Document
-print(Document.__init__)  # See the signature of the __init__ method to confirm it's the right one
 from typing import List, Dict, Any, Tuple
 import random
+
+from goldenverba.components.interfaces import Chunker
 from goldenverba.components.document import Document
 from goldenverba.components.chunk import Chunk
 
@@ -1,5 +1,4 @@
 from goldenverba.components.chunk import Chunk
-from typing import Optional, List
 from typing import Optional, List, Dict, Any
 
 class Document:
@@ -3,6 +3,7 @@ from weaviate import Client
 import os
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 from goldenverba.components.interfaces import Embedder
 from goldenverba.components.document import Document
@@ -18,6 +19,9 @@ class OllamaEmbedder(Embedder):
         self.vectorizer = "OLLAMA"
         self.url = os.environ.get("OLLAMA_URL", "")
         self.model = os.environ.get("OLLAMA_EMBED_MODEL", os.environ.get("OLLAMA_MODEL",""))
+        # Keep-alive connections reused across the embedding requests
+        self.session = requests.Session()
+        self.max_concurrent_batches = 4
 
     def embed(
         self,
@@ -31,20 +35,57 @@ class OllamaEmbedder(Embedder):
         @parameter: batch_size : int - Batch Size of Input
         @returns bool - Bool whether the embedding what successful.
         """
-        for document in tqdm(
-            documents, total=len(documents), desc="Vectorizing document chunks"
-        ):
-            for chunk in tqdm(document.chunks, total=len(document.chunks), desc="Vectorizing Chunks"):
-                chunk.set_vector(self.vectorize_chunk(document.name + " : " + chunk.text))
+        chunks = []
+        texts = []
+        for document in documents:
+            for chunk in document.chunks:
+                chunks.append(chunk)
+                texts.append(document.name + " : " + chunk.text)
+
+        vectors = self.vectorize_chunks(texts)
+        for chunk, vector in zip(chunks, vectors):
+            chunk.set_vector(vector)
 
         return self.import_data(documents, client, logging)
 
+    def vectorize_chunks(self, chunks: list[str], batch_size: int = 256) -> list[list[float]]:
+        """Embed many texts with Ollama's batch endpoint
+        @parameter: chunks : list[str] - Texts to embed
+        @parameter: batch_size : int - Number of texts per request
+        @returns list[list[float]] - One vector per text, in input order.
+        """
+        batches = [chunks[i : i + batch_size] for i in range(0, len(chunks), batch_size)]
+        vectors = []
+
+        # Keep a few batches in flight to overlap request latency, map keeps input order
+        with ThreadPoolExecutor(max_workers=self.max_concurrent_batches) as executor:
+            for batch_vectors in tqdm(
+                executor.map(self.vectorize_batch, batches),
+                total=len(batches),
+                desc="Vectorizing Chunks",
+            ):
+                vectors.extend(batch_vectors)
+        return vectors
+
+    def vectorize_batch(self, batch: list[str]) -> list[list[float]]:
+        response = self.session.post(
+            self.url + "/api/embed", json={"model": self.model, "input": batch}
+        )
+        embeddings = None
+        if response.ok:
+            embeddings = response.json().get("embeddings")
+
+        # Older Ollama versions only offer the single-prompt endpoint
+        if not embeddings or len(embeddings) != len(batch):
+            return [self.vectorize_chunk(chunk) for chunk in batch]
+        return embeddings
+
     def vectorize_chunk(self, chunk) -> list[float]:
         try:
             embeddings = []
             embedding_url = self.url + "/api/embeddings"
             data = {"model": self.model, "prompt": chunk}
-            response = requests.post(embedding_url, json=data)
+            response = self.session.post(embedding_url, json=data)
             json_data = json.loads(response.text)
             embeddings = json_data.get("embedding", [])
             return embeddings
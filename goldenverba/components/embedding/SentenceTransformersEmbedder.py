@@ -1,4 +1,3 @@
-from tqdm import tqdm
 from wasabi import msg
 from weaviate import Client
 
@@ -36,17 +35,23 @@ class SentenceTransformersEmbedder(Embedder):
         @parameter: batch_size : int - Batch Size of Input
         @returns bool - Bool whether the embedding what successful.
         """
-        # TODO: Call model.encode with a list of chunks instead of a single chunk for faster inference
-        for document in tqdm(
-            documents, total=len(documents), desc="Vectorizing document chunks"
-        ):
-            for chunk in document.chunks:
-                chunk.set_vector(self.vectorize_chunk(chunk.text))
+        # Encode all chunks in one call so the model can batch them
+        chunks = [chunk for document in documents for chunk in document.chunks]
+        vectors = self.vectorize_chunks([chunk.text for chunk in chunks])
+        for chunk, vector in zip(chunks, vectors):
+            chunk.set_vector(vector)
 
         return self.import_data(documents, client, logging)
 
     def vectorize_chunk(self, chunk) -> list[float]:
         return self.model.encode(chunk).tolist()
 
+    def vectorize_chunks(self, chunks: list[str], batch_size: int = 64) -> list[list[float]]:
+        if not chunks:
+            return []
+        return self.model.encode(
+            chunks, batch_size=batch_size, show_progress_bar=True
+        ).tolist()
+
     def vectorize_query(self, query: str) -> list[float]:
         return self.vectorize_chunk(query)
@@ -1,6 +1,6 @@
 import os
 import aiohttp
-import json
+import orjson
 
 from goldenverba.components.interfaces import Generator
 
@@ -64,7 +64,7 @@ class CohereGenerator(Generator):
                     if response.status == 200:
                             async for line in response.content:
                                 if line.strip():
-                                    json_data = json.loads(line.decode('utf-8'))
+                                    json_data = orjson.loads(line)
                                     message = json_data.get("text", "")
                                     finish_reason = "stop" if json_data.get("finish_reason", "") == "COMPLETE" else ""
 
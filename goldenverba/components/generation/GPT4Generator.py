@@ -5,6 +5,23 @@ from goldenverba.components.interfaces import Generator
 load_dotenv()
 
 
+def get_openai_arguments() -> dict:
+    """Read the OpenAI connection settings from the environment
+    @returns dict - Keyword arguments passed to a ChatCompletion request instead of mutating the global openai module.
+    """
+    arguments = {"api_key": os.environ.get("OPENAI_API_KEY", "")}
+
+    base_url = os.environ.get("OPENAI_API_BASE", os.environ.get("OPENAI_BASE_URL", ""))
+    if base_url:
+        arguments["api_base"] = base_url
+    if "OPENAI_API_TYPE" in os.environ:
+        arguments["api_type"] = os.environ["OPENAI_API_TYPE"]
+    if "OPENAI_API_VERSION" in os.environ:
+        arguments["api_version"] = os.environ["OPENAI_API_VERSION"]
+
+    return arguments
+
+
 class GPT4Generator(Generator):
     """
     GPT4 Generator.
@@ -33,8 +50,9 @@ class GPT4Generator(Generator):
         @returns Iterator[dict] - Token response generated by the Generator in this format {system:TOKEN, finish_reason:stop or empty}.
         """
 
-        url = os.environ.get("OPENAI_API_KEY", "")
-        if url == "":
+        # The settings are read per request so they always match the environment
+        openai_arguments = get_openai_arguments()
+        if openai_arguments["api_key"] == "":
             yield {
                 "message": "Missing OpenAI API Key",
                 "finish_reason": "stop",
@@ -47,25 +65,14 @@ class GPT4Generator(Generator):
         try:
             import openai
 
-            openai.api_key = os.getenv("OPENAI_API_KEY")
-            base_url = os.environ.get("OPENAI_BASE_URL", "")
-            if base_url:
-                openai.api_base = base_url
-
-            if "OPENAI_API_TYPE" in os.environ:
-                openai.api_type = os.getenv("OPENAI_API_TYPE")
-            if "OPENAI_API_BASE" in os.environ:
-                openai.api_base = os.getenv("OPENAI_API_BASE")
-            if "OPENAI_API_VERSION" in os.environ:
-                openai.api_version = os.getenv("OPENAI_API_VERSION")
-
             chat_completion_arguments = {
+                **openai_arguments,
                 "model": self.model_name,
                 "messages": messages,
                 "stream": True,
                 "temperature": 0.0,
             }
-            if openai.api_type == "azure":
+            if openai_arguments.get("api_type") == "azure":
                 chat_completion_arguments["deployment_id"] = self.model_name
 
             completion = await openai.ChatCompletion.acreate(
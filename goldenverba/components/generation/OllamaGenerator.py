@@ -1,7 +1,7 @@
 import os
 
-import json
 import aiohttp
+import orjson
 
 from goldenverba.components.interfaces import Generator
 
@@ -48,9 +48,7 @@ class OllamaGenerator(Generator):
                 async with session.post(url, json=data) as response:
                     async for line in response.content:
                         if line.strip():  # Ensure line is not just whitespace
-                            json_data = json.loads(
-                                line.decode("utf-8")
-                            )  # Decode bytes to string then to JSON
+                            json_data = orjson.loads(line)  # Parse the bytes directly
 
                             if "error" in json_data:
                                 message = json_data.get("error", "Unexpected Error")
@@ -4,7 +4,9 @@ from goldenverba.components.types import InputText, FileData, InputNumber
 
 import logging
 import os
+import threading
 import time
+from collections import OrderedDict
 from dotenv import load_dotenv
 
 from tqdm import tqdm
@@ -24,6 +26,10 @@ from goldenverba.components.schema.schema_generation import (
 
 load_dotenv()
 
+# The weaviate v3 client has one shared Batch that isn't thread-safe, every
+# `with client.batch` block holds this lock so writers don't flush each other's objects
+BATCH_LOCK = threading.RLock()
+
 
 class VerbaComponent:
     """
@@ -132,6 +138,30 @@ class Chunker(VerbaComponent):
         raise NotImplementedError("chunk method must be implemented by a subclass.")
 
 
+class SemanticCachePolicy:
+    """
+    Eviction policy for the semantic cache, drops the oldest entries once the
+    cache holds more than max_entries. The size is checked every
+    check_interval inserts.
+    """
+
+    def __init__(self, max_entries: int = 10000, check_interval: int = 100):
+        self.max_entries = max_entries
+        self.check_interval = check_interval
+        self.inserts = 0
+        self.lock = threading.Lock()
+
+    def record_insert(self, count: int = 1) -> bool:
+        """Count inserted entries
+        @parameter count : int - Number of inserted entries
+        @returns bool - Whether the cache size should be checked now.
+        """
+        with self.lock:
+            previous = self.inserts
+            self.inserts += count
+            return previous // self.check_interval != self.inserts // self.check_interval
+
+
 class Embedder(VerbaComponent):
     """
     Interface for Verba Embedding.
@@ -140,6 +170,11 @@ class Embedder(VerbaComponent):
     def __init__(self):
         super().__init__()
         self.vectorizer = ""
+        self.query_vector_cache = OrderedDict()
+        self.query_vector_cache_size = 4096
+        self.query_vector_cache_lock = threading.Lock()
+        # Set to None to let the semantic cache grow without eviction
+        self.semantic_cache_policy = SemanticCachePolicy()
 
     def embed(
         documents: list[Document],
@@ -169,6 +204,12 @@ class Embedder(VerbaComponent):
                 msg.fail(f"Vectorizer of {self.vectorizer} not found")
                 raise Exception(f"Vectorizer of {self.vectorizer} not found")
 
+            # Loop invariants, resolved once instead of per chunk
+            doc_class_name = self.get_document_class()
+            chunk_class_name = self.get_chunk_class()
+            wait_time_ms = int(os.getenv("WAIT_TIME_BETWEEN_INGESTION_QUERIES_MS", "0"))
+            wait_time = float(wait_time_ms) / 1000
+
             for i, document in enumerate(documents):
                 batches = []
                 uuid = ""
@@ -191,8 +232,7 @@ class Embedder(VerbaComponent):
                     f"({i+1}/{len(documents)}) Importing document {document.name} with {len(batches)} batches"
                 )
 
-                with client.batch as batch:
-                    batch.batch_size = 1
+                with BATCH_LOCK, client.batch:
                     properties = {
                         "text": str(document.text),
                         "doc_name": str(document.name),
@@ -205,8 +245,7 @@ class Embedder(VerbaComponent):
                         "example_images": document.example_images,  # Add example_images
                     }
 
-                    class_name = "VERBA_Document_" + strip_non_letters(self.vectorizer)
-                    uuid = client.batch.add_data_object(properties, class_name)
+                    uuid = client.batch.add_data_object(properties, doc_class_name)
 
                     for chunk in document.chunks:
                         chunk.set_uuid(uuid)
@@ -215,8 +254,8 @@ class Embedder(VerbaComponent):
                 for _batch_id, chunk_batch in tqdm(
                     enumerate(batches), total=len(batches), desc="Importing batches"
                 ):
-                    with client.batch as batch:
-                        batch.batch_size = len(chunk_batch)
+                    # Each token-limited chunk batch is sent when its block exits
+                    with BATCH_LOCK, client.batch:
                         for i, chunk in enumerate(chunk_batch):
                             chunk_count += 1
 
@@ -229,33 +268,29 @@ class Embedder(VerbaComponent):
                                 "tags": chunk.tags,  # Add tags to chunks
                                 "public_id": chunk.public_id,  # Add public_id to chunks
                             }
-                            class_name = "VERBA_Chunk_" + strip_non_letters(
-                                self.vectorizer
-                            )
 
                             # Check if vector already exists
                             if chunk.vector is None:
                                 try:
-                                    client.batch.add_data_object(properties, class_name)
+                                    client.batch.add_data_object(
+                                        properties, chunk_class_name
+                                    )
                                 except Exception as e:
                                     msg.fail(f"Error adding chunk to Weaviate: {e}")
                             else:
                                 client.batch.add_data_object(
-                                    properties, class_name, vector=chunk.vector
+                                    properties, chunk_class_name, vector=chunk.vector
                                 )
 
-                            wait_time_ms = int(
-                                os.getenv("WAIT_TIME_BETWEEN_INGESTION_QUERIES_MS", "0")
-                            )
                             if wait_time_ms > 0:
-                                time.sleep(float(wait_time_ms) / 1000)
+                                time.sleep(wait_time)
 
                 self.check_document_status(
                     client,
                     uuid,
                     document.name,
-                    "VERBA_Document_" + strip_non_letters(self.vectorizer),
-                    "VERBA_Chunk_" + strip_non_letters(self.vectorizer),
+                    doc_class_name,
+                    chunk_class_name,
                     len(document.chunks),
                     logging,
                 )
@@ -352,6 +387,42 @@ class Embedder(VerbaComponent):
 
         msg.warn(f"Deleted document {doc_id} and its chunks")
 
+    def remove_documents_by_ids(self, client: Client, doc_ids: list[str]):
+        """Remove documents and their chunks with one batch delete per class
+        @parameter client : Client - Weaviate Client
+        @parameter doc_ids : list[str] - Document ids (UUID format)
+        @returns None.
+        """
+        if not doc_ids:
+            return
+
+        doc_class_name = "VERBA_Document_" + strip_non_letters(self.vectorizer)
+        chunk_class_name = "VERBA_Chunk_" + strip_non_letters(self.vectorizer)
+
+        client.batch.delete_objects(
+            class_name=doc_class_name,
+            where={
+                "operator": "Or",
+                "operands": [
+                    {"path": ["id"], "operator": "Equal", "valueText": doc_id}
+                    for doc_id in doc_ids
+                ],
+            },
+        )
+
+        client.batch.delete_objects(
+            class_name=chunk_class_name,
+            where={
+                "operator": "Or",
+                "operands": [
+                    {"path": ["doc_uuid"], "operator": "Equal", "valueText": doc_id}
+                    for doc_id in doc_ids
+                ],
+            },
+        )
+
+        msg.warn(f"Deleted documents {', '.join(doc_ids)} and their chunks")
+
     def get_document_class(self) -> str:
         return "VERBA_Document_" + strip_non_letters(self.vectorizer)
 
@@ -399,7 +470,7 @@ class Embedder(VerbaComponent):
                 )
                 .with_offset(offset)
                 .with_additional(properties=["id"])
-                .with_limit(100)
+                .with_limit(pageSize)
                 .do()
             )
 
@@ -417,19 +488,39 @@ class Embedder(VerbaComponent):
             "vectorize_query method must be implemented by a subclass."
         )
 
+    def vectorize_query_cached(self, query: str) -> list[float]:
+        """Vectorize a query, reusing the vector of an identical earlier query
+        @parameter: query : str - User query
+        @returns list[float] - Query vector.
+        """
+        cache = self.query_vector_cache
+        with self.query_vector_cache_lock:
+            vector = cache.get(query)
+            if vector is not None:
+                cache.move_to_end(query)
+                return vector
+
+        # The lock isn't held while the embedding model runs
+        vector = self.vectorize_query(query)
+        with self.query_vector_cache_lock:
+            cache[query] = vector
+            cache.move_to_end(query)
+            if len(cache) > self.query_vector_cache_size:
+                cache.popitem(last=False)
+        return vector
+
     def conversation_to_query(self, queries: list[str], conversation: dict) -> str:
-        query = ""
+        parts = []
 
         if len(conversation) > 1:
             if conversation[-1].type == "system":
-                query += conversation[-1].content + " "
+                parts.append(conversation[-1].content)
             elif conversation[-2].type == "system":
-                query += conversation[-2].content + " "
+                parts.append(conversation[-2].content)
 
-        for _query in queries:
-            query += _query + " "
+        parts.extend(queries)
 
-        return query.lower()
+        return "".join(part + " " for part in parts).lower()
 
     def retrieve_semantic_cache(
         self, client: Client, query: str, dist: float = 0.04
@@ -480,7 +571,7 @@ class Embedder(VerbaComponent):
         )
 
         if needs_vectorization:
-            vector = self.vectorize_query(query)
+            vector = self.vectorize_query_cached(query)
             query_results = query_results.with_near_vector(
                 content={"vector": vector},
             ).do()
@@ -515,23 +606,72 @@ class Embedder(VerbaComponent):
         @parameter system : str - System message
         @returns None.
         """
-        needs_vectorization = self.get_need_vectorization()
+        properties = {
+            "query": str(query),
+            "system": system,
+        }
 
-        with client.batch as batch:
-            batch.batch_size = 1
-            properties = {
-                "query": str(query),
-                "system": system,
-            }
-            msg.good("Saved to cache")
-
-            if needs_vectorization:
-                vector = self.vectorize_query(query)
-                client.batch.add_data_object(
-                    properties, self.get_cache_class(), vector=vector
-                )
-            else:
-                client.batch.add_data_object(properties, self.get_cache_class())
+        # A single object is created directly, the shared client batch
+        # stays free for imports
+        vector = None
+        if self.get_need_vectorization():
+            vector = self.vectorize_query_cached(query)
+        client.data_object.create(properties, self.get_cache_class(), vector=vector)
+        msg.good("Saved to cache")
+
+        if (
+            self.semantic_cache_policy is not None
+            and self.semantic_cache_policy.record_insert()
+        ):
+            self.evict_semantic_cache(client)
+
+    def evict_semantic_cache(self, client: Client):
+        """Evict the oldest entries once the semantic cache is full
+        @parameter client : Client - Weaviate Client
+        @returns None.
+        """
+        policy = self.semantic_cache_policy
+        cache_class = self.get_cache_class()
+
+        count_results = client.query.aggregate(cache_class).with_meta_count().do()
+        count = (
+            count_results.get("data", {})
+            .get("Aggregate", {})
+            .get(cache_class, [{}])[0]
+            .get("meta", {})
+            .get("count", 0)
+        )
+        excess = count - policy.max_entries
+        if excess <= 0:
+            return
+
+        oldest_results = (
+            client.query.get(class_name=cache_class, properties=["query"])
+            .with_additional(properties=["id"])
+            .with_sort({"path": ["_creationTimeUnix"], "order": "asc"})
+            .with_limit(excess)
+            .do()
+        )
+        evicted = [
+            entry["_additional"]["id"]
+            for entry in oldest_results.get("data", {}).get("Get", {}).get(cache_class)
+            or []
+        ]
+        if not evicted:
+            return
+
+        with BATCH_LOCK:
+            client.batch.delete_objects(
+                class_name=cache_class,
+                where={
+                    "operator": "Or",
+                    "operands": [
+                        {"path": ["id"], "operator": "Equal", "valueText": uuid}
+                        for uuid in evicted
+                    ],
+                },
+            )
+        msg.info(f"Evicted {len(evicted)} entries from the semantic cache")
 
 
 class Retriever(VerbaComponent):
@@ -580,7 +720,6 @@ class Generator(VerbaComponent):
 
     def __init__(self):
         super().__init__()
-        logging.basicConfig(level=logging.INFO)
         logging.info("Initializing Generator with default settings.")
 
         self.streamable = False
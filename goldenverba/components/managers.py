@@ -12,6 +12,9 @@ from goldenverba.components.interfaces import (
     Generator,
 )
 import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
 from goldenverba.components.reader.BasicReader import BasicReader
 from goldenverba.components.reader.GitReader import GitHubReader
 from goldenverba.components.reader.GitLabReader import GitLabReader
@@ -80,9 +83,16 @@ class ReaderManager:
                 }
             )
 
-        documents, logging = self.readers[self.selected_reader].load(
-            fileData, textValues, logging
-        )
+        reader = self.readers[self.selected_reader]
+        # Opt-in: spread uploaded files over worker processes for CPU-heavy parsing
+        processes = int(os.environ.get("LOAD_DOCUMENTS_NUMBER_OF_THREADS", "0") or 0)
+
+        if processes > 1 and len(fileData) > 1 and not textValues:
+            documents, logging = self.load_in_processes(
+                reader, fileData, logging, processes
+            )
+        else:
+            documents, logging = reader.load(fileData, textValues, logging)
 
         elapsed_time = round(time.time() - start_time, 2)  # Calculate elapsed time
 
@@ -96,6 +106,37 @@ class ReaderManager:
 
         return documents, logging
 
+    def load_in_processes(
+        self,
+        reader: Reader,
+        fileData: list[FileData],
+        logging: list[dict],
+        processes: int,
+    ) -> tuple[list[Document], list[dict]]:
+        processes = min(processes, len(fileData))
+        slice_size = -(-len(fileData) // processes)
+        slices = [
+            fileData[i : i + slice_size] for i in range(0, len(fileData), slice_size)
+        ]
+
+        documents = []
+        # Fork would copy the server's threads and their held locks into the
+        # workers, spawned workers start from a clean interpreter
+        with ProcessPoolExecutor(
+            max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+        ) as executor:
+            futures = [
+                executor.submit(reader.load, file_slice, [], [])
+                for file_slice in slices
+            ]
+            # Collect in submission order so documents keep the upload order
+            for future in futures:
+                slice_documents, slice_logging = future.result()
+                documents.extend(slice_documents)
+                logging.extend(slice_logging)
+
+        return documents, logging
+
     def set_reader(self, reader: str):
         if reader in self.readers:
             msg.info(f"Setting READER to {reader}")
@@ -128,13 +169,12 @@ class ChunkerManager:
         )
         if self.check_chunks(chunked_docs):
             elapsed_time = round(time.time() - start_time, 2)  # Calculate elapsed time
-            msg.good(
-                f"Chunking completed with {sum([len(document.chunks) for document in chunked_docs])} chunks in {elapsed_time}s"
-            )
+            chunk_count = sum([len(document.chunks) for document in chunked_docs])
+            msg.good(f"Chunking completed with {chunk_count} chunks in {elapsed_time}s")
             logging.append(
                 {
                     "type": "SUCCESS",
-                    "message": f"Chunking completed with {sum([len(document.chunks) for document in chunked_docs])} chunks in {elapsed_time}s",
+                    "message": f"Chunking completed with {chunk_count} chunks in {elapsed_time}s",
                 }
             )
             return chunked_docs, logging
@@ -211,13 +251,14 @@ class EmbeddingManager:
             documents, client, logging
         )
         elapsed_time = round(time.time() - start_time, 2)  # Calculate elapsed time
+        chunk_count = sum([len(document.chunks) for document in documents])
         msg.good(
-            f"Embedding completed with {len(documents)} Documents and {sum([len(document.chunks) for document in documents])} chunks in {elapsed_time}s"
+            f"Embedding completed with {len(documents)} Documents and {chunk_count} chunks in {elapsed_time}s"
         )
         logging.append(
             {
                 "type": "SUCCESS",
-                "message": f"Embedding completed with {len(documents)} Documents and {sum([len(document.chunks) for document in documents])} chunks in {elapsed_time}s",
+                "message": f"Embedding completed with {len(documents)} Documents and {chunk_count} chunks in {elapsed_time}s",
             }
         )
         return successful_embedding
@@ -36,6 +36,7 @@ class BasicReader(Reader):
 
         documents = []
         
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         for file in fileData:
             msg.info(f"Loading in {file.filename}")
             logging.append({"type": "INFO", "message": f"Importing {file.filename}"})
@@ -49,7 +50,7 @@ class BasicReader(Reader):
                         name=file.filename,
                         text=original_text,
                         type=self.config["document_type"].text,
-                        timestamp=str(datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+                        timestamp=timestamp,
                         reader=self.name,
                     )
                     documents.append(document)
@@ -84,17 +85,16 @@ class BasicReader(Reader):
                 try:
                     pdf_bytes = io.BytesIO(base64.b64decode(file.content))
 
-                    full_text = ""
                     reader = PdfReader(pdf_bytes)
-
-                    for page in reader.pages:
-                        full_text += page.extract_text() + "\n\n"
+                    full_text = "".join(
+                        page.extract_text() + "\n\n" for page in reader.pages
+                    )
 
                     document = Document(
                         name=file.filename,
                         text=full_text,
                         type=self.config["document_type"].text,
-                        timestamp=str(datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+                        timestamp=timestamp,
                         reader=self.name,
                     )
                     documents.append(document)
@@ -112,17 +112,16 @@ class BasicReader(Reader):
                 try:
                     docx_bytes = io.BytesIO(base64.b64decode(file.content))
 
-                    full_text = ""
                     reader = docx.Document(docx_bytes)
+                    full_text = "".join(
+                        paragraph.text + "\n" for paragraph in reader.paragraphs
+                    )
 
-                    for paragraph in reader.paragraphs:
-                        full_text += paragraph.text + "\n"
-                    
                     document = Document(
                         name=file.filename,
                         text=full_text,
                         type=self.config["document_type"].text,
-                        timestamp=str(datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+                        timestamp=timestamp,
                         reader=self.name,
                     )
                     documents.append(document)
@@ -1,11 +1,10 @@
 import base64
-import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from wasabi import msg
-
 
-from datetime import datetime
 from wasabi import msg
+
 from goldenverba.components.document import Document
 from goldenverba.components.interfaces import Reader
 from goldenverba.components.types import FileData
@@ -16,46 +15,64 @@ class CustomMemeReader(Reader):
         self.name = "CustomMemeReader"
         self.description = "Imports custom meme JSON files."
 
-    print("THE CUSTOMMEME READER IS BEING CREATED")
-
     def load(self, fileData: list[FileData], textValues: list[str], logging: list[dict]) -> tuple[list[Document], list[dict]]:
-        documents = []
         msg.info(f"CustomMemeReader: Processing {len(fileData)} files")
 
-        for file in fileData:
-            if file.extension == "json":
-                try:
-                    content = self.decode_content(file.content)
-                    meme_data = json.loads(content)
-
-                    document = Document(
-                        name=meme_data['meme_id'],
-                        text=meme_data['about'],
-                        type="meme",
-                        timestamp=str(datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
-                        reader=self.name,
-                        tags=meme_data.get('tags', []),
-                        example_images=meme_data.get('example_images', []),
-                        template_images=meme_data.get('template_images', []),
-                        metadata={
-                            'views': meme_data.get('views', 0),
-                            'comments': meme_data.get('comments', 0),
-                            'type': meme_data.get('type', []),
-                            'status': meme_data.get('status', '')
-                        }
-                    )
-                    documents.append(document)
-                    msg.good(f"Successfully processed: {file.filename}")
-                except Exception as e:
-                    msg.warn(f"Failed to load {file.filename} : {str(e)}")
-                    logging.append({
-                        "type": "WARNING",
-                        "message": f"Failed to load {file.filename} : {str(e)}",
-                    })
+        json_files = [file for file in fileData if file.extension == "json"]
+        if not json_files:
+            return [], logging
+
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+
+        # Decode and parse the uploads concurrently, results keep upload order
+        with ThreadPoolExecutor(max_workers=min(32, len(json_files))) as executor:
+            results = list(
+                executor.map(lambda file: self.parse_file(file, timestamp), json_files)
+            )
+
+        documents = []
+        for file, (document, error) in zip(json_files, results):
+            if document is not None:
+                documents.append(document)
+                msg.good(f"Successfully processed: {file.filename}")
+            else:
+                msg.warn(f"Failed to load {file.filename} : {error}")
+                logging.append({
+                    "type": "WARNING",
+                    "message": f"Failed to load {file.filename} : {error}",
+                })
         return documents, logging
 
+    def parse_file(self, file: FileData, timestamp: str) -> tuple[Document | None, str | None]:
+        try:
+            content = self.decode_content(file.content)
+            meme_data = orjson.loads(content)
+
+            document = Document(
+                name=meme_data['meme_id'],
+                text=meme_data['about'],
+                type="meme",
+                timestamp=timestamp,
+                reader=self.name,
+                tags=meme_data.get('tags', []),
+                example_images=meme_data.get('example_images', []),
+                template_images=meme_data.get('template_images', []),
+                metadata={
+                    'views': meme_data.get('views', 0),
+                    'comments': meme_data.get('comments', 0),
+                    'type': meme_data.get('type', []),
+                    'status': meme_data.get('status', '')
+                }
+            )
+            return document, None
+        except Exception as e:
+            return None, str(e)
+
     def decode_content(self, content):
+        # Plain JSON uploads can't be base64, so skip the decode attempt
+        if isinstance(content, str) and content.lstrip()[:1] in ("{", "["):
+            return content
         try:
             return base64.b64decode(content).decode('utf-8')
-        except:
+        except ValueError:
             return content
\ No newline at end of file
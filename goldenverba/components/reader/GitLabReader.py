@@ -24,6 +24,7 @@ class GitLabReader(Reader):
         self.type = "URL"
         self.requires_env = ["GITLAB_TOKEN"]
         self.description = "Downloads only text files from a GitLab repository and ingests it into Verba. Use this format {owner}/{name}/{branch}/{folder} (e.g gitlab-org/gitlab/master/doc)"
+        self.session = requests.Session()
 
     def load(self, fileData: list[FileData], textValues: list[str], logging: list[dict]) -> tuple[list[Document], list[str]]:
         
@@ -48,6 +49,7 @@ class GitLabReader(Reader):
         documents = []
         docs, logging = self.fetch_docs(gitlab_link, logging)
 
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         for _file in docs:
             try:
                 logging.append({"type": "INFO", "message": f"Downloading {_file}"})
@@ -66,7 +68,7 @@ class GitLabReader(Reader):
                         name=_file,
                         link=link,
                         path=_path,
-                        timestamp=str(datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+                        timestamp=timestamp,
                         reader=self.name,
                     )
 
@@ -95,7 +97,7 @@ class GitLabReader(Reader):
         headers = {
             "Authorization": f"Bearer {os.environ.get('GITLAB_TOKEN', '')}",
         }
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
         response.raise_for_status()
 
         files = [
@@ -130,7 +132,7 @@ class GitLabReader(Reader):
         headers = {
             "Authorization": f"Bearer {os.environ.get('GITLAB_TOKEN', '')}",
         }
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
         response.raise_for_status()
 
         content = response.text
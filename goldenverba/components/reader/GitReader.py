@@ -23,6 +23,7 @@ class GitHubReader(Reader):
         self.type = "URL"
         self.requires_env = ["GITHUB_TOKEN"]
         self.description = "Retrieves all text files (.txt, .md, .mdx, .json) from a GitHub Repository and imports them into Verba. Use this format {owner}/{repo}/{branch}/{folder}"
+        self.session = requests.Session()
 
     def load(
         self, fileData: list[FileData], textValues: list[str], logging: list[dict]
@@ -49,6 +50,7 @@ class GitHubReader(Reader):
         documents = []
         docs, logging = self.fetch_docs(github_link, logging)
 
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         for _file in docs:
             try:
                 logging.append({"type": "INFO", "message": f"Downloading {_file}"})
@@ -67,7 +69,7 @@ class GitHubReader(Reader):
                         name=_file,
                         link=link,
                         path=_path,
-                        timestamp=str(datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+                        timestamp=timestamp,
                         reader=self.name,
                     )
 
@@ -101,7 +103,7 @@ class GitHubReader(Reader):
             "Authorization": f"token {os.environ.get('GITHUB_TOKEN', '')}",
             "Accept": "application/vnd.github.v3+json",
         }
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
         response.raise_for_status()  # Raise an exception for HTTP errors
 
         files = [
@@ -142,7 +144,7 @@ class GitHubReader(Reader):
             "Authorization": f"token {os.environ.get('GITHUB_TOKEN', '')}",
             "Accept": "application/vnd.github.v3+json",
         }
-        response = requests.get(url, headers=headers)
+        response = self.session.get(url, headers=headers)
         response.raise_for_status()
 
         content_b64 = response.json()["content"]
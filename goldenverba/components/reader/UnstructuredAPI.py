@@ -22,6 +22,7 @@ class UnstructuredReader(Reader):
         self.requires_env = ["UNSTRUCTURED_API_KEY"]
         self.name = "UnstructuredAPI"
         self.description = "Uses the Unstructured API to import multiple file types such as plain text and documents (.pdf, .csv). Requires an Unstructured API Key"
+        self.session = requests.Session()
 
     def load(
         self, fileData: list[FileData], textValues: list[str], logging: list[dict]
@@ -50,6 +51,7 @@ class UnstructuredReader(Reader):
             "strategy": "auto",
         }
 
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         for file in fileData:
             msg.info(f"Loading in {file.filename}")
             logging.append({"type": "INFO", "message": f"Importing {file.filename}"})
@@ -58,7 +60,7 @@ class UnstructuredReader(Reader):
             file_data = {"files": (file.filename, file_bytes)}
 
             try:
-                response = requests.post(
+                response = self.session.post(
                     url, headers=headers, data=data, files=file_data
                 )
                 json_response = response.json()
@@ -95,7 +97,7 @@ class UnstructuredReader(Reader):
                     name=file.filename,
                     text=full_content,
                     type=self.config["document_type"].text,
-                    timestamp=str(datetime.now().strftime("%Y-%m-%d %H:%M:%S")),
+                    timestamp=timestamp,
                     reader=self.name,
                 )
                 documents.append(document)
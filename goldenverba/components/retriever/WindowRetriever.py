@@ -1,3 +1,6 @@
+import heapq
+from operator import attrgetter
+
 from weaviate import Client
 from weaviate.gql.get import HybridFusion
 
@@ -31,8 +34,13 @@ class WindowRetriever(Retriever):
         needs_vectorization = embedder.get_need_vectorization()
         chunks = []
 
-        for query in queries:
-            query_results = (
+        if not queries:
+            return chunks, ""
+
+        # Send every query as an aliased sub-query of a single GraphQL request
+        query_builders = []
+        for i, query in enumerate(queries):
+            query_builder = (
                 client.query.get(
                     class_name=chunk_class,
                     properties=[
@@ -45,29 +53,39 @@ class WindowRetriever(Retriever):
                 )
                 .with_additional(properties=["score"])
                 .with_autocut(1)
+                .with_alias(f"query_{i}")
             )
 
             if needs_vectorization:
-                vector = embedder.vectorize_query(query)
-                query_results = query_results.with_hybrid(
+                vector = embedder.vectorize_query_cached(query)
+                query_builder = query_builder.with_hybrid(
                     query=query,
                     vector=vector,
                     fusion_type=HybridFusion.RELATIVE_SCORE,
                     properties=[
                         "text",
                     ],
-                ).do()
+                )
 
             else:
-                query_results = query_results.with_hybrid(
+                query_builder = query_builder.with_hybrid(
                     query=query,
                     fusion_type=HybridFusion.RELATIVE_SCORE,
                     properties=[
                         "text",
                     ],
-                ).do()
+                )
+
+            query_builders.append(query_builder)
 
-            for chunk in query_results["data"]["Get"][chunk_class]:
+        query_results = client.query.multi_get(query_builders).do()
+
+        # Weaviate returns each query's results ranked by score, so the per-query
+        # lists only need merging rather than a full sort
+        ranked_results = []
+        for i in range(len(query_builders)):
+            query_chunks = []
+            for chunk in query_results["data"]["Get"][f"query_{i}"]:
                 chunk_obj = Chunk(
                     chunk["text"],
                     chunk["doc_name"],
@@ -76,9 +94,16 @@ class WindowRetriever(Retriever):
                     chunk["chunk_id"],
                 )
                 chunk_obj.set_score(chunk["_additional"]["score"])
-                chunks.append(chunk_obj)
-
-        sorted_chunks = sorted(chunks, key=lambda x: x.score, reverse=True)
+                query_chunks.append(chunk_obj)
+            chunks.extend(query_chunks)
+            ranked_results.append(query_chunks)
+
+        if len(ranked_results) == 1:
+            sorted_chunks = list(ranked_results[0])
+        else:
+            sorted_chunks = list(
+                heapq.merge(*ranked_results, key=attrgetter("score"), reverse=True)
+            )
 
         context = self.combine_context(chunks, client, embedder)
 
@@ -91,8 +116,10 @@ class WindowRetriever(Retriever):
         embedder: Embedder,
     ) -> str:
         doc_name_map = {}
+        chunk_class = embedder.get_chunk_class()
 
-        context = ""
+        context_parts = []
+        append = context_parts.append
 
         for chunk in chunks:
             if chunk.doc_name not in doc_name_map:
@@ -109,6 +136,9 @@ class WindowRetriever(Retriever):
             added_chunks = {}
             for chunk in chunk_map:
                 chunk_id = int(chunk)
+                # Neighbours share the document of the matched chunk, so only
+                # the fields that differ per chunk are fetched
+                anchor = chunk_map[chunk]
                 all_chunk_range = list(range(chunk_id - window, chunk_id + window + 1))
                 for _range in all_chunk_range:
                     if (
@@ -118,13 +148,10 @@ class WindowRetriever(Retriever):
                     ):
                         chunk_retrieval_results = (
                             client.query.get(
-                                class_name=embedder.get_chunk_class(),
+                                class_name=chunk_class,
                                 properties=[
                                     "text",
-                                    "doc_name",
                                     "chunk_id",
-                                    "doc_uuid",
-                                    "doc_type",
                                 ],
                             )
                             .with_where(
@@ -139,7 +166,7 @@ class WindowRetriever(Retriever):
                                         {
                                             "path": ["doc_name"],
                                             "operator": "Equal",
-                                            "valueText": chunk_map[chunk].doc_name,
+                                            "valueText": anchor.doc_name,
                                         },
                                     ],
                                 }
@@ -149,25 +176,14 @@ class WindowRetriever(Retriever):
                         )
 
                         if "data" in chunk_retrieval_results:
-                            if chunk_retrieval_results["data"]["Get"][
-                                embedder.get_chunk_class()
-                            ]:
+                            neighbours = chunk_retrieval_results["data"]["Get"][chunk_class]
+                            if neighbours:
                                 chunk_obj = Chunk(
-                                    chunk_retrieval_results["data"]["Get"][
-                                        embedder.get_chunk_class()
-                                    ][0]["text"],
-                                    chunk_retrieval_results["data"]["Get"][
-                                        embedder.get_chunk_class()
-                                    ][0]["doc_name"],
-                                    chunk_retrieval_results["data"]["Get"][
-                                        embedder.get_chunk_class()
-                                    ][0]["doc_type"],
-                                    chunk_retrieval_results["data"]["Get"][
-                                        embedder.get_chunk_class()
-                                    ][0]["doc_uuid"],
-                                    chunk_retrieval_results["data"]["Get"][
-                                        embedder.get_chunk_class()
-                                    ][0]["chunk_id"],
+                                    neighbours[0]["text"],
+                                    anchor.doc_name,
+                                    anchor.doc_type,
+                                    anchor.doc_uuid,
+                                    neighbours[0]["chunk_id"],
                                 )
                                 added_chunks[str(_range)] = chunk_obj
 
@@ -181,9 +197,9 @@ class WindowRetriever(Retriever):
                 for k in sorted(doc_name_map[doc]["chunks"], key=lambda x: int(x))
             }
 
-            context += "--- Document " + doc + " ---" + "\n\n"
+            append("--- Document " + doc + " ---" + "\n\n")
 
             for chunk in sorted_dict:
-                context += "Chunk "+ str(sorted_dict[chunk].chunk_id) + "\n\n" + sorted_dict[chunk].text + "\n\n"
+                append("Chunk "+ str(sorted_dict[chunk].chunk_id) + "\n\n" + sorted_dict[chunk].text + "\n\n")
 
-        return context
+        return "".join(context_parts)
@@ -1,5 +1,6 @@
 import re
 import os
+from functools import lru_cache
 from dotenv import load_dotenv
 from wasabi import msg  # type: ignore[import]
 from weaviate import Client
@@ -17,8 +18,13 @@ if google_project != None:
     VECTORIZERS.add("text2vec-palm")
 
 
+NON_ALPHANUMERIC = re.compile(r"[^a-zA-Z0-9]")
+
+
+@lru_cache(maxsize=256)
 def strip_non_letters(s: str):
-    return re.sub(r"[^a-zA-Z0-9]", "_", s)
+    # Only called with the handful of vectorizer names, so results are memoized
+    return NON_ALPHANUMERIC.sub("_", s)
 
 
 def verify_vectorizer(
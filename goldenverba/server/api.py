@@ -1,12 +1,20 @@
-from fastapi import FastAPI, WebSocket, status
+from fastapi import FastAPI, Request, WebSocket, status
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
 
+import asyncio
+import hashlib
+import logging
 import os
+import orjson
+from operator import attrgetter
+from collections import OrderedDict
 from pathlib import Path
 
 from dotenv import load_dotenv
+from pydantic import TypeAdapter
 from starlette.websockets import WebSocketDisconnect
 from wasabi import msg  # type: ignore[import]
 import time
@@ -25,6 +33,19 @@ from goldenverba.server.util import get_config, set_config, setup_managers
 
 load_dotenv()
 
+# Logging is configured once when the server starts. Only the goldenverba
+# loggers get a handler, the root logger of the hosting process is left alone
+package_logger = logging.getLogger("goldenverba")
+if not package_logger.handlers:
+    log_handler = logging.StreamHandler()
+    log_handler.setFormatter(
+        logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+    )
+    package_logger.addHandler(log_handler)
+package_logger.setLevel(os.environ.get("VERBA_LOG_LEVEL", "INFO").upper())
+
+logger = logging.getLogger(__name__)
+
 # Check if runs in production
 production_key = os.environ.get("VERBA_PRODUCTION", "")
 tag = os.environ.get("VERBA_GOOGLE_TAG", "")
@@ -34,11 +55,63 @@ if production_key == "True":
 else:
     production = False
 
+# The health check bodies only depend on startup settings, serialize them once
+HEALTHY_BODY = orjson.dumps({"message": "Alive!", "production": production, "gtag": tag})
+NOT_READY_BODY = orjson.dumps(
+    {"message": "Database not ready!", "production": production, "gtag": tag}
+)
+
+# Fixed bodies of the endpoints that are disabled in production. Only the bytes
+# are shared, middleware adds headers to the response objects per request
+EMPTY_BODY = b"{}"
+PRODUCTION_IMPORT_BODY = orjson.dumps(
+    {"logging": [{"type": "ERROR", "message": "Can't import when in production mode"}]}
+)
+PRODUCTION_CONFIG_BODY = orjson.dumps(
+    {"status": "200", "status_msg": "Config can't be updated in Production Mode"}
+)
+
+# Streamed tokens are sent once this many characters are buffered or this
+# many seconds passed since the last frame
+STREAM_FLUSH_SIZE = 512
+STREAM_FLUSH_INTERVAL = 0.025
+
+# Chunk attributes returned by /api/query, read in one attrgetter call
+CHUNK_FIELDS = (
+    "text",
+    "doc_name",
+    "chunk_id",
+    "doc_uuid",
+    "doc_type",
+    "score",
+    "public_id",
+    "tags",
+)
+get_chunk_fields = attrgetter(*CHUNK_FIELDS)
+
+# Validator for websocket generate frames, built once instead of per message
+generate_payload_adapter = TypeAdapter(GeneratePayload)
+
 manager = verba_manager.VerbaManager()
 setup_managers(manager)
 
+# Installed libraries and environment variables are only checked when the
+# manager is created, so their status page ordering is computed once
+sorted_libraries = dict(
+    sorted(
+        manager.installed_libraries.items(),
+        key=lambda item: (not item[1], item[0]),
+    )
+)
+sorted_variables = dict(
+    sorted(
+        manager.environment_variables.items(),
+        key=lambda item: (not item[1], item[0]),
+    )
+)
+
 # FastAPI App
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 origins = [
     "http://localhost:3000",
@@ -54,14 +127,32 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,  # Let browsers reuse preflight results for a day
 )
 
+# Compress the frontend bundles and larger API responses, the build ships no
+# precompressed assets
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+
 BASE_DIR = Path(__file__).resolve().parent
 
+
+class ImmutableStaticFiles(StaticFiles):
+    """
+    StaticFiles for content-hashed build assets, lets browsers cache them indefinitely.
+    """
+
+    async def get_response(self, path: str, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers["Cache-Control"] = "public, max-age=31536000, immutable"
+        return response
+
+
 # Serve the assets (JS, CSS, images, etc.)
 app.mount(
     "/static/_next",
-    StaticFiles(directory=BASE_DIR / "frontend/out/_next"),
+    ImmutableStaticFiles(directory=BASE_DIR / "frontend/out/_next"),
     name="next-assets",
 )
 
@@ -69,10 +160,62 @@ app.mount(
 app.mount("/static", StaticFiles(directory=BASE_DIR / "frontend/out"), name="app")
 
 
+# The built index page doesn't change while the server runs, read it once
+INDEX_HTML = (BASE_DIR / "frontend/out/index.html").read_bytes()
+INDEX_ETAG = '"' + hashlib.md5(INDEX_HTML).hexdigest() + '"'
+
+
 @app.get("/")
 @app.head("/")
-async def serve_frontend():
-    return FileResponse(os.path.join(BASE_DIR, "frontend/out/index.html"))
+async def serve_frontend(request: Request):
+    if request.headers.get("if-none-match") == INDEX_ETAG:
+        return Response(status_code=304, headers={"ETag": INDEX_ETAG})
+    return Response(
+        content=INDEX_HTML, media_type="text/html", headers={"ETag": INDEX_ETAG}
+    )
+
+# Repeated searches are answered from memory until they expire or the data changes
+QUERY_CACHE_TTL = 300
+QUERY_CACHE_SIZE = 1024
+query_cache = OrderedDict()
+
+
+def get_cached_query(query: str):
+    entry = query_cache.get(query)
+    if entry is None:
+        return None
+    timestamp, content = entry
+    if time.monotonic() - timestamp > QUERY_CACHE_TTL:
+        del query_cache[query]
+        return None
+    query_cache.move_to_end(query)
+    return content
+
+
+def cache_query(query: str, content: dict):
+    query_cache[query] = (time.monotonic(), content)
+    query_cache.move_to_end(query)
+    if len(query_cache) > QUERY_CACHE_SIZE:
+        query_cache.popitem(last=False)
+
+
+def invalidate_caches():
+    manager.clear_document_types_cache()
+    query_cache.clear()
+
+async def stream_documents(documents_obj: list[dict], fields: dict):
+    """Serialize a document listing record by record instead of as one payload
+    @parameter documents_obj : list[dict] - Documents for the "documents" key
+    @parameter fields : dict - Remaining top-level fields of the response
+    @returns AsyncIterator[bytes] - JSON object split into chunks.
+    """
+    yield b'{"documents":['
+    for i, document_obj in enumerate(documents_obj):
+        if i:
+            yield b","
+        yield orjson.dumps(document_obj, option=orjson.OPT_NON_STR_KEYS)
+    # Splice the remaining fields into the same object by dropping their opening brace
+    yield b"]," + orjson.dumps(fields, option=orjson.OPT_NON_STR_KEYS)[1:]
 
 ### GET
 
@@ -80,22 +223,17 @@ async def serve_frontend():
 @app.get("/api/health")
 async def health_check():
     try:
-        if manager.client.is_ready():
-            return JSONResponse(
-                content={"message": "Alive!", "production": production, "gtag": tag}
-            )
+        if await asyncio.to_thread(manager.client.is_ready):
+            return Response(content=HEALTHY_BODY, media_type="application/json")
         else:
-            return JSONResponse(
-                content={
-                    "message": "Database not ready!",
-                    "production": production,
-                    "gtag": tag,
-                },
+            return Response(
+                content=NOT_READY_BODY,
+                media_type="application/json",
                 status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             )
     except Exception as e:
         msg.fail(f"Healthcheck failed with {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "message": f"Healthcheck failed with {str(e)}",
                 "production": production,
@@ -108,24 +246,11 @@ async def health_check():
 @app.get("/api/get_status")
 async def get_status():
     try:
-        schemas = manager.get_schemas()
+        schemas = await asyncio.to_thread(manager.get_schemas)
         sorted_schemas = dict(
             sorted(schemas.items(), key=lambda item: item[1], reverse=True)
         )
 
-        sorted_libraries = dict(
-            sorted(
-                manager.installed_libraries.items(),
-                key=lambda item: (not item[1], item[0]),
-            )
-        )
-        sorted_variables = dict(
-            sorted(
-                manager.environment_variables.items(),
-                key=lambda item: (not item[1], item[0]),
-            )
-        )
-
         data = {
             "type": manager.weaviate_type,
             "libraries": sorted_libraries,
@@ -134,8 +259,8 @@ async def get_status():
             "error": "",
         }
 
-        msg.info("Status Retrieved")
-        return JSONResponse(content=data)
+        logger.info("Status Retrieved")
+        return ORJSONResponse(content=data)
     except Exception as e:
         data = {
             "type": "",
@@ -145,19 +270,19 @@ async def get_status():
             "error": f"Status retrieval failed: {str(e)}",
         }
         msg.fail(f"Status retrieval failed: {str(e)}")
-        return JSONResponse(content=data)
+        return ORJSONResponse(content=data)
 
 # Get Configuration
 @app.get("/api/config")
 async def retrieve_config():
     try:
         config = get_config(manager)
-        msg.info("Config Retrieved")
-        return JSONResponse(status_code=200, content={"data": config, "error": ""})
+        logger.info("Config Retrieved")
+        return ORJSONResponse(status_code=200, content={"data": config, "error": ""})
 
     except Exception as e:
         msg.warn(f"Could not retrieve configuration: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "data": {},
@@ -179,18 +304,77 @@ async def websocket_generate_stream(websocket: WebSocket):
         try:
             data = await websocket.receive_text()
             # Parse and validate the JSON string using Pydantic model
-            payload = GeneratePayload.model_validate_json(data)
-            msg.good(f"Received generate stream call for {payload.query}")
-            full_text = ""
-            async for chunk in manager.generate_stream_answer(
-                [payload.query], [payload.context], payload.conversation
-            ):
-                full_text += chunk["message"]
+            payload = generate_payload_adapter.validate_python(orjson.loads(data))
+            logger.info("Received generate stream call for %s", payload.query)
+            parts = []
+            # Tokens are coalesced into one frame until enough text has
+            # accumulated, enough time has passed, or the stream finishes.
+            # The next token is awaited with a timeout so a pausing generator
+            # doesn't hold back text that is already buffered.
+            pending = []
+            pending_size = 0
+            last_chunk = None
+            last_flush = time.monotonic()
+
+            async def send_pending(chunk: dict):
+                nonlocal pending, pending_size, last_chunk, last_flush
+                chunk["message"] = "".join(pending)
                 if chunk["finish_reason"] == "stop":
-                    chunk["full_text"] = full_text
-                # Log the payload before sending it back to the client
-                msg.info(f"Sending chunk to client: {chunk}")
-                await websocket.send_json(chunk)
+                    chunk["full_text"] = "".join(parts)
+                # The frame is encoded once for both the log and the client
+                frame = orjson.dumps(chunk).decode()
+                logger.debug("Sending chunk to client: %s", frame)
+                await websocket.send_text(frame)
+                pending = []
+                pending_size = 0
+                last_chunk = None
+                last_flush = time.monotonic()
+
+            stream = manager.generate_stream_answer(
+                [payload.query], [payload.context], payload.conversation
+            )
+            next_chunk = None
+            try:
+                while True:
+                    if next_chunk is None:
+                        next_chunk = asyncio.ensure_future(stream.__anext__())
+                    timeout = None
+                    if pending:
+                        timeout = max(
+                            0, STREAM_FLUSH_INTERVAL - (time.monotonic() - last_flush)
+                        )
+                    done, _ = await asyncio.wait({next_chunk}, timeout=timeout)
+                    if not done:
+                        await send_pending(last_chunk)
+                        continue
+
+                    try:
+                        chunk = next_chunk.result()
+                    except StopAsyncIteration:
+                        break
+                    finally:
+                        next_chunk = None
+
+                    parts.append(chunk["message"])
+                    pending.append(chunk["message"])
+                    pending_size += len(chunk["message"])
+                    last_chunk = chunk
+                    if (
+                        not chunk["finish_reason"]
+                        and pending_size < STREAM_FLUSH_SIZE
+                        and time.monotonic() - last_flush < STREAM_FLUSH_INTERVAL
+                    ):
+                        continue
+                    await send_pending(chunk)
+            finally:
+                if next_chunk is not None:
+                    next_chunk.cancel()
+                    await asyncio.gather(next_chunk, return_exceptions=True)
+                await stream.aclose()
+
+            if last_chunk is not None:
+                last_chunk["message"] = "".join(pending)
+                await websocket.send_text(orjson.dumps(last_chunk).decode())
 
         except WebSocketDisconnect:
             msg.warn("WebSocket connection closed by client.")
@@ -199,10 +383,10 @@ async def websocket_generate_stream(websocket: WebSocket):
         except Exception as e:
             msg.fail(f"WebSocket Error: {str(e)}")
             error_response = {"message": str(e), "finish_reason": "stop", "full_text": str(e)}
-            # Log the error payload before sending it back to the client
-            msg.info(f"Sending error response to client: {error_response}")
-            await websocket.send_json(error_response)
-        msg.good("Successfully streamed answer")
+            frame = orjson.dumps(error_response).decode()
+            logger.debug("Sending error response to client: %s", frame)
+            await websocket.send_text(frame)
+        logger.info("Successfully streamed answer")
 
 ### POST
 
@@ -216,26 +400,27 @@ The function checks the payload and resets the Verba application accordingly.
 @app.post("/api/reset")
 async def reset_verba(payload: ResetPayload):
     if production:
-        return JSONResponse(status_code=200, content={})
+        return Response(content=EMPTY_BODY, media_type="application/json")
 
     try:
         if payload.resetMode == "VERBA":
-            manager.reset()
+            await asyncio.to_thread(manager.reset)
         elif payload.resetMode == "DOCUMENTS":
-            manager.reset_documents()
+            await asyncio.to_thread(manager.reset_documents)
         elif payload.resetMode == "CACHE":
-            manager.reset_cache()
+            await asyncio.to_thread(manager.reset_cache)
         elif payload.resetMode == "SUGGESTIONS":
-            manager.reset_suggestion()
+            await asyncio.to_thread(manager.reset_suggestion)
         elif payload.resetMode == "CONFIG":
-            manager.reset_config()
+            await asyncio.to_thread(manager.reset_config)
 
         msg.info(f"Resetting Verba ({payload.resetMode})")
 
     except Exception as e:
         msg.warn(f"Failed to reset Verba {str(e)}")
 
-    return JSONResponse(status_code=200, content={})
+    invalidate_caches()
+    return ORJSONResponse(status_code=200, content={})
 
 # Receive query and return chunks and query answer
 @app.post("/api/import")
@@ -248,22 +433,16 @@ The function checks the payload, imports the data, and returns a JSON response w
     logging = []
 
     if production:
-        logging.append(
-            {"type": "ERROR", "message": "Can't import when in production mode"}
-        )
-        return JSONResponse(
-            content={
-                "logging": logging,
-            }
-        )
+        return Response(content=PRODUCTION_IMPORT_BODY, media_type="application/json")
 
     try:
         set_config(manager, payload.config)
-        documents, logging = manager.import_data(
-            payload.data, payload.textValues, logging
+        documents, logging = await asyncio.to_thread(
+            manager.import_data, payload.data, payload.textValues, logging
         )
+        invalidate_caches()
 
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "logging": logging,
             }
@@ -271,7 +450,7 @@ The function checks the payload, imports the data, and returns a JSON response w
 
     except Exception as e:
         logging.append({"type": "ERROR", "message": "Unexpected error: "+str(e)})
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "logging": logging,
             }
@@ -285,19 +464,17 @@ The function checks the payload and updates the configuration accordingly.'''
 async def update_config(payload: ConfigPayload):
 
     if production:
-        return JSONResponse(
-            content={
-                "status": "200",
-                "status_msg": "Config can't be updated in Production Mode",
-            }
-        )
+        return Response(content=PRODUCTION_CONFIG_BODY, media_type="application/json")
 
     try:
         set_config(manager, payload.config)
     except Exception as e:
         msg.warn(f"Failed to set new Config {str(e)}")
 
-    return JSONResponse(
+    # The selected embedder and retriever decide what is listed and retrieved
+    invalidate_caches()
+
+    return ORJSONResponse(
         content={
             "status": "200",
             "status_msg": "Config Updated",
@@ -307,30 +484,26 @@ async def update_config(payload: ConfigPayload):
 # Receive query and return chunks and query answer
 @app.post("/api/query")
 async def query(payload: QueryPayload):
-    msg.good(f"Received query: {payload.query}")
-    start_time = time.time()  # Start timing
-    try:
-        chunks, context, chunk_info, first_template_public_id = manager.retrieve_chunks([payload.query])
+    logger.info("Received query: %s", payload.query)
+    start_time = time.perf_counter()  # Start timing
+    query_key = payload.query.strip().lower()
+    cached_content = get_cached_query(query_key)
+    if cached_content is not None:
+        logger.info("Answered query from cache: %s", payload.query)
+        # The cached content keeps the time of the original query
+        elapsed_time = round(time.perf_counter() - start_time, 3)
+        return ORJSONResponse(content={**cached_content, "took": elapsed_time})
 
-        retrieved_chunks = [
-            {
-                "text": chunk.text,
-                "doc_name": chunk.doc_name,
-                "chunk_id": chunk.chunk_id,
-                "doc_uuid": chunk.doc_uuid,
-                "doc_type": chunk.doc_type,
-                "score": chunk.score,
-                "public_id": chunk.public_id,
-                "tags": chunk.tags
-            }
-            for chunk in chunks
-        ]
+    try:
+        chunks, context, chunk_info, first_template_public_id = await asyncio.to_thread(
+            manager.retrieve_chunks, [payload.query]
+        )
 
-        elapsed_time = round(time.time() - start_time, 2)  # Calculate elapsed time
-        msg.good(f"Successfully processed query: {payload.query} in {elapsed_time}s")
+        elapsed_time = round(time.perf_counter() - start_time, 3)  # Calculate elapsed time
+        logger.info("Successfully processed query: %s in %ss", payload.query, elapsed_time)
 
-        if len(chunks) == 0:
-            return JSONResponse(
+        if not chunks:
+            return ORJSONResponse(
                 content={
                     "chunks": [],
                     "took": 0,
@@ -341,20 +514,24 @@ async def query(payload: QueryPayload):
                 }
             )
 
-        return JSONResponse(
-            content={
-                "error": "",
-                "chunks": retrieved_chunks,
-                "context": context,
-                "took": elapsed_time,
-                "chunk_info": chunk_info,
-                "first_template_public_id": first_template_public_id
-            }
-        )
+        retrieved_chunks = [
+            dict(zip(CHUNK_FIELDS, get_chunk_fields(chunk))) for chunk in chunks
+        ]
+
+        content = {
+            "error": "",
+            "chunks": retrieved_chunks,
+            "context": context,
+            "took": elapsed_time,
+            "chunk_info": chunk_info,
+            "first_template_public_id": first_template_public_id
+        }
+        cache_query(query_key, content)
+        return ORJSONResponse(content=content)
 
     except Exception as e:
         msg.warn(f"Query failed: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=500,
             content={
                 "chunks": [],
@@ -370,15 +547,15 @@ async def query(payload: QueryPayload):
 @app.post("/api/suggestions")
 async def suggestions(payload: QueryPayload):
     try:
-        suggestions = manager.get_suggestions(payload.query)
+        suggestions = await asyncio.to_thread(manager.get_suggestions, payload.query)
 
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "suggestions": suggestions,
             }
         )
     except Exception:
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "suggestions": [],
             }
@@ -388,13 +565,13 @@ async def suggestions(payload: QueryPayload):
 @app.post("/api/get_document")
 async def get_document(payload: GetDocumentPayload):
     # TODO Standarize Document Creation
-    msg.info(f"Document ID received: {payload.document_id}")
+    logger.info("Document ID received: %s", payload.document_id)
 
     try:
-        document = manager.retrieve_document(payload.document_id)
+        document = await asyncio.to_thread(manager.retrieve_document, payload.document_id)
         if document is None:
-            msg.warning(f"No document found with ID: {payload.document_id}")
-            return JSONResponse(
+            logger.warning("No document found with ID: %s", payload.document_id)
+            return ORJSONResponse(
                 content={
                     "error": "Document not found",
                     "document": None,
@@ -402,32 +579,30 @@ async def get_document(payload: GetDocumentPayload):
             )
 
         # Log the complete document object
-        msg.info(f"Complete Document Data: {document}")
+        logger.debug("Complete Document Data: %s", document)
 
-        document_properties = document.get("properties", {})
+        # Known properties are popped from a copy, whatever is left becomes meta
+        properties = dict(document.get("properties", {}))
         document_obj = {
             "class": document.get("class", "No Class"),
             "id": document.get("id", payload.document_id),
-            "chunks": document_properties.get("chunk_count", 0),
-            "link": document_properties.get("doc_link", ""),
-            "name": document_properties.get("doc_name", "No name"),
-            "type": document_properties.get("doc_type", "No type"),
-            "text": document_properties.get("text", "No text"),
-            "timestamp": document_properties.get("timestamp", ""),
-            "tags": document_properties.get("tags", []),
-            "example_images": document_properties.get("example_images", []),
-            "template_images": document_properties.get("template_images", []),
-            "views": document_properties.get("views", 0),
-            "comments": document_properties.get("comments", 0),
-            "status": document_properties.get("status", ""),
-            "meta": {k: v for k, v in document_properties.items() if k not in [
-                "chunk_count", "doc_link", "doc_name", "doc_type", "text", "timestamp",
-                "tags", "example_images", "template_images", "views", "comments", "status"
-            ]}
+            "chunks": properties.pop("chunk_count", 0),
+            "link": properties.pop("doc_link", ""),
+            "name": properties.pop("doc_name", "No name"),
+            "type": properties.pop("doc_type", "No type"),
+            "text": properties.pop("text", "No text"),
+            "timestamp": properties.pop("timestamp", ""),
+            "tags": properties.pop("tags", []),
+            "example_images": properties.pop("example_images", []),
+            "template_images": properties.pop("template_images", []),
+            "views": properties.pop("views", 0),
+            "comments": properties.pop("comments", 0),
+            "status": properties.pop("status", ""),
         }
+        document_obj["meta"] = properties
 
-        msg.good(f"Succesfully retrieved document: {payload.document_id}")
-        return JSONResponse(
+        logger.info("Succesfully retrieved document: %s", payload.document_id)
+        return ORJSONResponse(
             content={
                 "error": "",
                 "document": document_obj,
@@ -435,7 +610,7 @@ async def get_document(payload: GetDocumentPayload):
         )
     except Exception as e:
         msg.fail(f"Document retrieval failed: {str(e)}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "error": str(e),
                 "document": None,
@@ -446,28 +621,35 @@ async def get_document(payload: GetDocumentPayload):
 @app.post("/api/get_all_documents")
 
 async def get_all_documents(payload: SearchQueryPayload):
-    msg.info("Get all documents request received")
-    start_time = time.time()  # Start timing
+    logger.info("Get all documents request received")
+    start_time = time.perf_counter()  # Start timing
 
     try:
         # Check Weaviate connection
-        if not manager.client.is_ready():
+        if not await asyncio.to_thread(manager.client.is_ready):
             msg.fail("Weaviate connection is not ready")
             raise Exception("Weaviate connection is not ready")
 
         if payload.query == "":
-            documents = manager.retrieve_all_documents(
-                payload.doc_type, payload.page, payload.pageSize
+            documents = await asyncio.to_thread(
+                manager.retrieve_all_documents,
+                payload.doc_type,
+                payload.page,
+                payload.pageSize,
             )
-            msg.info(f"Retrieved documents: {documents}")
+            logger.debug("Retrieved documents: %s", documents)
         else:
-            documents = manager.search_documents(
-                payload.query, payload.doc_type, payload.page, payload.pageSize
+            documents = await asyncio.to_thread(
+                manager.search_documents,
+                payload.query,
+                payload.doc_type,
+                payload.page,
+                payload.pageSize,
             )
-            msg.info(f"Searched documents: {documents}")
+            logger.debug("Searched documents: %s", documents)
 
         if not documents:
-            return JSONResponse(
+            return ORJSONResponse(
                 content={
                     "documents": [],
                     "doc_types": [],
@@ -479,48 +661,56 @@ async def get_all_documents(payload: SearchQueryPayload):
 
         documents_obj = []
         for document in documents:
-            _additional = document["_additional"]
+            # Listed meta keeps chunk_count, tags and images, only the fields
+            # below are moved out of it
+            properties = dict(document)
+            _additional = properties.pop("_additional")
             documents_obj.append(
                 {
                     "class": "No Class",
                     "uuid": _additional.get("id", "none"),
-                    "chunks": document.get("chunk_count", 0),
-                    "link": document.get("doc_link", ""),
-                    "name": document.get("doc_name", "No name"),
-                    "type": document.get("doc_type", "No type"),
-                    "text": document.get("text", "No text"),
-                    "timestamp": document.get("timestamp", ""),
-                    "tags": document.get("tags", []),
-                    "example_images": document.get("example_images", []),
-                    "template_images": document.get("template_images", []),
+                    "chunks": properties.get("chunk_count", 0),
+                    "link": properties.pop("doc_link", ""),
+                    "name": properties.pop("doc_name", "No name"),
+                    "type": properties.pop("doc_type", "No type"),
+                    "text": properties.pop("text", "No text"),
+                    "timestamp": properties.pop("timestamp", ""),
+                    "tags": properties.get("tags", []),
+                    "example_images": properties.get("example_images", []),
+                    "template_images": properties.get("template_images", []),
                     "views": 0,  # Default value since it's not in the schema
                     "comments": 0,  # Default value since it's not in the schema
                     "status": "",  # Default value since it's not in the schema
-                    "meta": {k: v for k, v in document.items() if k not in ["doc_name", "doc_type", "doc_link", "text", "timestamp", "_additional"]}
+                    "meta": properties,
                 }
             )
 
-        elapsed_time = round(time.time() - start_time, 2)  # Calculate elapsed time
-        msg.good(
-            f"Successfully retrieved document: {len(documents)} documents in {elapsed_time}s"
+        elapsed_time = round(time.perf_counter() - start_time, 3)  # Calculate elapsed time
+        logger.info(
+            "Successfully retrieved document: %s documents in %ss",
+            len(documents),
+            elapsed_time,
         )
 
-        doc_types = manager.retrieve_all_document_types()
+        doc_types = await asyncio.to_thread(manager.retrieve_all_document_types)
 
-        return JSONResponse(
-            content={
-                "documents": documents_obj,
-                "doc_types": list(doc_types),
-                "current_embedder": manager.embedder_manager.selected_embedder,
-                "error": "",
-                "took": elapsed_time,
-            }
+        return StreamingResponse(
+            stream_documents(
+                documents_obj,
+                {
+                    "doc_types": list(doc_types),
+                    "current_embedder": manager.embedder_manager.selected_embedder,
+                    "error": "",
+                    "took": elapsed_time,
+                },
+            ),
+            media_type="application/json",
         )
     except Exception as e:
         msg.fail(f"All Document retrieval failed: {str(e)}")
         import traceback
         msg.fail(f"Traceback: {traceback.format_exc()}")
-        return JSONResponse(
+        return ORJSONResponse(
             content={
                 "documents": [],
                 "doc_types": [],
@@ -536,9 +726,10 @@ async def get_all_documents(payload: SearchQueryPayload):
 async def delete_document(payload: GetDocumentPayload):
     if production:
         msg.warn("Can't delete documents when in Production Mode")
-        return JSONResponse(status_code=200, content={})
+        return Response(content=EMPTY_BODY, media_type="application/json")
 
-    msg.info(f"Document ID received: {payload.document_id}")
+    logger.info("Document ID received: %s", payload.document_id)
 
-    manager.delete_document_by_id(payload.document_id)
-    return JSONResponse(content={})
+    await asyncio.to_thread(manager.delete_document_by_id, payload.document_id)
+    invalidate_caches()
+    return ORJSONResponse(content={})
@@ -1,4 +1,5 @@
 from goldenverba.verba_manager import VerbaManager
+from goldenverba.components.interfaces import BATCH_LOCK
 
 import json
 import os
@@ -197,8 +198,7 @@ def save_config(manager: VerbaManager, config: dict):
     if exists:
         manager.client.data_object.delete(uuid=config_uuid, class_name="VERBA_Config")
 
-    with manager.client.batch as batch:
-        batch.batch_size = 1
+    with BATCH_LOCK, manager.client.batch:
         properties = {
             "config": json.dumps(config),
         }
@@ -1,7 +1,18 @@
+import asyncio
+import atexit
+import bisect
+import importlib.util
 import os
 import ssl
+import sys
 import logging
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
+import orjson
 import weaviate
 from dotenv import load_dotenv, find_dotenv
 from wasabi import msg
@@ -10,7 +21,6 @@ from weaviate.embedded import EmbeddedOptions
 import goldenverba.components.schema.schema_generation as schema_manager
 from goldenverba.components.chunking.MemeChunker import MemeChunker
 
-from goldenverba.components.generation.VideoEditingGenerator import VideoEditingGenerator, VideoEditingInstructions
 
 
 from goldenverba.components.chunk import Chunk
@@ -18,6 +28,7 @@ from goldenverba.components.document import Document
 from goldenverba.components.types import FileData
 
 from goldenverba.components.interfaces import (
+    BATCH_LOCK,
     VerbaComponent,
     Reader,
     Chunker,
@@ -35,6 +46,72 @@ from goldenverba.components.managers import (
 
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# Environment variables shown on the status page
+ENVIRONMENT_VARIABLES = (
+    "OLLAMA_URL",
+    "OLLAMA_MODEL",
+    "OLLAMA_EMBED_MODEL",
+    "OPENAI_API_KEY",
+    "OPENAI_BASE_URL",
+    "COHERE_API_KEY",
+    "GITHUB_TOKEN",
+    "GITLAB_TOKEN",
+    "UNSTRUCTURED_API_KEY",
+    # Should be set to "azure" if using Azure OpenAI
+    "OPENAI_API_TYPE",
+    "OPENAI_API_VERSION",
+    "GOOGLE_CLOUD_PROJECT",
+    "GOOGLE_APPLICATION_CREDENTIALS",
+    # Mandatory when using Azure, XXX when the endpoint is https://XXX.openai.azure.com
+    "AZURE_OPENAI_RESOURCE_NAME",
+    # Mandatory when using Azure, typically "text-embedding-ada-002"
+    "AZURE_OPENAI_EMBEDDING_MODEL",
+    # Mandatory when using Azure, also changes the query model when using OpenAI
+    "OPENAI_MODEL",
+)
+
+# Required when OPENAI_API_TYPE is "azure"
+AZURE_REQUIRED = (
+    "OPENAI_BASE_URL",
+    "AZURE_OPENAI_RESOURCE_NAME",
+    "AZURE_OPENAI_EMBEDDING_MODEL",
+    "OPENAI_MODEL",
+)
+
+# Libraries shown on the status page, mapped to the module that provides them
+LIBRARY_MODULES = {
+    "pypdf": "pypdf",
+    "docx": "docx",
+    "sentence-transformers": "sentence_transformers",
+    "tiktoken": "tiktoken",
+    "openai": "openai",
+    "vertexai": "vertexai",
+    "transformers": "transformers",
+    "accelerate": "accelerate",
+    "torch": "torch",
+}
+
+
+def _flush_suggestions_later(manager_ref: weakref.ref):
+    # Timers and the exit hook only hold a weak reference, they don't keep
+    # a discarded manager alive
+    manager = manager_ref()
+    if manager is not None:
+        manager.flush_suggestions_safely()
+
+
+def _flush_suggestions_at_exit(manager_ref: weakref.ref):
+    manager = manager_ref()
+    if manager is None:
+        return
+    try:
+        manager.flush_suggestions()
+    except Exception as e:
+        msg.warn(f"Saving suggestions at exit failed: {str(e)}")
+
+
 class VerbaManager:
     """
     Manages all Verba Components and provides methods for system operations.
@@ -60,17 +137,149 @@ class VerbaManager:
         self.weaviate_type = ""
         self.client = self.setup_client()
         self.enable_caching = True
+        # Answer streaming by generator.streamable
+        self.stream_handlers = {
+            True: self._stream_tokens,
+            False: self._stream_complete,
+        }
+        self._doc_class_name = ""
+        self._doc_class_embedder = None
+        # Document types per class name, they only change on import or reset
+        self.document_types_cache = {}
+        self.document_types_ttl = 30
+
+        self.suggestion_buffer = []
+        # Recently seen queries in LRU order, skipped without asking Weaviate
+        self.seen_suggestions = OrderedDict()
+        self.seen_suggestions_size = 10000
+        self.suggestion_batch_size = 100
+        self.suggestion_flush_interval = 30
+        self.last_suggestion_flush = time.monotonic()
+        self.suggestion_lock = threading.Lock()
+        self.suggestion_timer = None
+        # Sorted (lowercase, suggestion) pairs for prefix autocomplete
+        self.suggestion_index = []
+        self.suggestion_index_loaded = False
+        atexit.register(_flush_suggestions_at_exit, weakref.ref(self))
+
+        # Keeps fire-and-forget writes referenced until they finish
+        self.background_tasks: set[asyncio.Task] = set()
+        self._initialized_schemas: set[str] = set()
+        self._schema_locks: dict[str, threading.Lock] = {}
 
         self.verify_installed_libraries()
         self.verify_variables()
         self.set_meme_chunker()
 
-        # Check if all schemas exist for all possible vectorizers
-        for vectorizer in schema_manager.VECTORIZERS:
-            schema_manager.init_schemas(self.client, vectorizer, False, True)
+        # Only the selected embedder needs its schemas right away, the other
+        # vectorizers are checked in the background
+        self._ensure_schema(self.selected_vectorizer)
+        threading.Thread(target=self._ensure_all_schemas, daemon=True).start()
+        threading.Thread(target=self._warm_cache, daemon=True).start()
+
+    @property
+    def selected_vectorizer(self) -> str:
+        return self.embedder_manager.embedders[
+            self.embedder_manager.selected_embedder
+        ].vectorizer
+
+    def _ensure_schema(self, vectorizer: str) -> None:
+        """
+        Create the schemas of a vectorizer if they were not checked yet.
+
+        Args:
+            vectorizer (str): Name of the vectorizer.
+        """
+        if vectorizer in self._initialized_schemas:
+            return
+        with self._schema_locks.setdefault(vectorizer, threading.Lock()):
+            if vectorizer in self._initialized_schemas:
+                return
+            if schema_manager.init_schemas(self.client, vectorizer, False, True):
+                self._initialized_schemas.add(vectorizer)
+
+    def _ensure_all_schemas(self) -> None:
+        for vectorizer in schema_manager.VECTORIZERS | schema_manager.EMBEDDINGS:
+            self._ensure_schema(vectorizer)
+
+    def _warm_cache(self) -> None:
+        """
+        Run vector searches against the chunk and cache classes of the selected
+        embedder, so Weaviate loads their HNSW vectors before the first user query.
+        Opt-in: VERBA_WARM_CACHE_LIMIT sets the number of objects touched per
+        class and defaults to 0, which skips the warm-up.
+        """
+        limit = int(os.environ.get("VERBA_WARM_CACHE_LIMIT", "0") or 0)
+        if limit <= 0:
+            return
+
+        embedder = self.embedder_manager.embedders[
+            self.embedder_manager.selected_embedder
+        ]
+        for class_name in (embedder.get_chunk_class(), embedder.get_cache_class()):
+            try:
+                self.client.query.aggregate(class_name).with_meta_count().do()
+                sample = (
+                    self.client.query.get(class_name)
+                    .with_additional(properties=["id", "vector"])
+                    .with_limit(1)
+                    .do()
+                )
+                objects = sample.get("data", {}).get("Get", {}).get(class_name) or []
+                if not objects:
+                    continue
+                (
+                    self.client.query.get(class_name)
+                    .with_near_vector({"vector": objects[0]["_additional"]["vector"]})
+                    .with_additional(properties=["id"])
+                    .with_limit(limit)
+                    .do()
+                )
+            except Exception as e:
+                msg.warn(f"Couldn't warm up {class_name}: {str(e)}")
+                continue
+            msg.info(f"Warmed up {class_name}")
+
+    def _run_in_background(self, function, *args) -> None:
+        """
+        Run a blocking call in a worker thread without waiting for it.
+
+        Args:
+            function (Callable): Blocking function to run.
+            *args: Arguments passed to the function.
+        """
+        task = asyncio.create_task(asyncio.to_thread(function, *args))
+        self.background_tasks.add(task)
+        task.add_done_callback(self._background_task_done)
+
+    def _background_task_done(self, task: asyncio.Task) -> None:
+        self.background_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            msg.warn(f"Background task failed: {task.exception()}")
+
+    def _for_each_vectorizer(self, function, vectorizers=None) -> None:
+        """
+        Run a schema operation for every vectorizer concurrently.
+
+        Args:
+            function (Callable[[str], Any]): Operation taking the vectorizer name.
+            vectorizers (list[str]): Vectorizers to run it for, defaults to all of them.
+        """
+        if vectorizers is None:
+            vectorizers = schema_manager.VECTORIZERS | schema_manager.EMBEDDINGS
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(function, vectorizers))
 
-        for embedding in schema_manager.EMBEDDINGS:
-            schema_manager.init_schemas(self.client, embedding, False, True)
+    def _reinit_all_schemas(self) -> None:
+        """
+        Re-create the schemas of every vectorizer after a reset.
+        """
+        self._initialized_schemas.clear()
+        vectorizers = sorted(schema_manager.VECTORIZERS | schema_manager.EMBEDDINGS)
+        # The first vectorizer also creates the shared suggestion and config
+        # classes, the others only check them afterwards
+        self._ensure_schema(vectorizers[0])
+        self._for_each_vectorizer(self._ensure_schema, vectorizers[1:])
 
     def import_data(
         self, fileData: list[FileData], textValues: list[str], logging: list[dict]
@@ -88,20 +297,29 @@ class VerbaManager:
             tuple: A tuple containing the list of processed documents and updated logging information.
         """
         
+        self._ensure_schema(self.selected_vectorizer)
+
         loaded_documents, logging = self.reader_manager.load(
             fileData, textValues, logging
         )
 
-        filtered_documents = []
-
         # Check if document names exist in DB
-        for document in loaded_documents:
-            if not self.check_if_document_exits(document):
-                filtered_documents.append(document)
-            else:
-                logging.append(
-                    {"type": "WARNING", "message": f"{document.name} already exists."}
-                )
+        names = [document.name for document in loaded_documents]
+        existing_names = self.get_existing_document_names(names)
+
+        filtered_documents = [
+            document
+            for document, name in zip(loaded_documents, names)
+            if name not in existing_names
+        ]
+
+        duplicate_names = [name for name in names if name in existing_names]
+        for name in duplicate_names:
+            msg.warn(f"{name} already exists")
+        logging.extend(
+            {"type": "WARNING", "message": f"{name} already exists."}
+            for name in duplicate_names
+        )
 
         modified_documents, logging = self.chunker_manager.chunk(
             filtered_documents, logging
@@ -110,6 +328,7 @@ class VerbaManager:
         logging = self.embedder_manager.embed(
             modified_documents, client=self.client, logging=logging
         )
+        self.clear_document_types_cache()
 
         return modified_documents, logging
 
@@ -136,8 +355,27 @@ class VerbaManager:
     def chunker_get_chunker(self) -> dict[str, Chunker]:
         return self.chunker_manager.get_chunkers()
 
+    @property
+    def doc_class_name(self) -> str:
+        """
+        Document class of the selected embedder, only rebuilt when the selection changes.
+
+        Returns:
+            str: Weaviate class name for documents.
+        """
+        selected_embedder = self.embedder_manager.selected_embedder
+        if self._doc_class_embedder != selected_embedder:
+            self._doc_class_name = "VERBA_Document_" + schema_manager.strip_non_letters(
+                self.embedder_manager.embedders[selected_embedder].vectorizer
+            )
+            self._doc_class_embedder = selected_embedder
+        return self._doc_class_name
+
     def embedder_set_embedder(self, embedder: str) -> bool:
-        return self.embedder_manager.set_embedder(embedder)
+        if not self.embedder_manager.set_embedder(embedder):
+            return False
+        self._ensure_schema(self.selected_vectorizer)
+        return True
 
     def embedder_get_embedder(self) -> dict[str, Embedder]:
         return self.embedder_manager.get_embedders()
@@ -166,6 +404,16 @@ class VerbaManager:
         additional_header = {}
         client = None
 
+        # Size the client's HTTP connection pool for concurrent requests from
+        # the API threads, never below the client's default of 20
+        pool_size = max(20, min(32, 4 * (os.cpu_count() or 1)))
+        additional_config = weaviate.Config(
+            connection_config=weaviate.ConnectionConfig(
+                session_pool_connections=pool_size,
+                session_pool_maxsize=pool_size,
+            )
+        )
+
         openai_header_key_name = "X-OpenAI-Api-Key"
 
         # Check OpenAI ENV KEY
@@ -218,12 +466,14 @@ class VerbaManager:
                     url=weaviate_url,
                     additional_headers=additional_header,
                     auth_client_secret=auth_config,
+                    additional_config=additional_config,
                 )
             else:
                 msg.info("No Auth information provided")
                 client = weaviate.Client(
                     url=weaviate_url,
                     additional_headers=additional_header,
+                    additional_config=additional_config,
                 )
             self.environment_variables["WEAVIATE_URL_VERBA"] = True
             self.weaviate_type = "Weaviate Cluster"
@@ -254,6 +504,7 @@ class VerbaManager:
                 embedded_options=EmbeddedOptions(
                     additional_env_vars=additional_env_vars
                 ),
+                additional_config=additional_config,
             )
 
         if client is not None:
@@ -267,7 +518,15 @@ class VerbaManager:
                             if "error" in result["result"]["errors"]:
                                 msg.fail(result["result"])
 
-            client.batch.configure(callback=batch_callback)
+            # Fixed-size batches, a single-object write is flushed when its
+            # `with client.batch` block exits
+            client.batch.configure(
+                batch_size=200,
+                dynamic=False,
+                timeout_retries=3,
+                connection_error_retries=3,
+                callback=batch_callback,
+            )
 
         else:
             msg.fail("Connection to Weaviate failed")
@@ -278,174 +537,37 @@ class VerbaManager:
         """
         Checks which libraries are installed and fills out the self.installed_libraries dictionary for the frontend to access, this will be displayed in the status page.
         """
-        try:
-            import pypdf
-            self.installed_libraries["pypdf"] = True
-        except Exception:
-            self.installed_libraries["pypdf"] = False
-
-        try:
-            import docx
-            self.installed_libraries["docx"] = True
-        except Exception:
-            self.installed_libraries["docx"] = False
-            
-        try:
-            import sentence_transformers
-            self.installed_libraries["sentence-transformers"] = True
-        except Exception:
-            self.installed_libraries["sentence-transformers"] = False
-
-        try:
-            import tiktoken
-            self.installed_libraries["tiktoken"] = True
-        except Exception:
-            self.installed_libraries["tiktoken"] = False
-
-        try:
-            import openai
-            self.installed_libraries["openai"] = True
-        except Exception:
-            self.installed_libraries["openai"] = False
-
-        try:
-            import vertexai
-            self.installed_libraries["vertexai"] = True
-        except Exception:
-            self.installed_libraries["vertexai"] = False
-
-        try:
-            import transformers
-            self.installed_libraries["transformers"] = True
-        except Exception:
-            self.installed_libraries["transformers"] = False
-
-        try:
-            import accelerate
-            self.installed_libraries["accelerate"] = True
-        except Exception:
-            self.installed_libraries["accelerate"] = False
+        # find_spec only locates the packages, none of them is imported here
+        for library, module in LIBRARY_MODULES.items():
+            self.installed_libraries[library] = (
+                importlib.util.find_spec(module) is not None
+            )
 
-        try:
-            import torch
+        # Report the torch device only if an embedder already imported torch
+        torch = sys.modules.get("torch")
+        if torch is not None:
             if torch.cuda.is_available():
                 msg.info("CUDA is available. Using CUDA...")
             elif torch.backends.mps.is_available():
                 msg.info("MPS is available. Using MPS...")
             else:
                 msg.info("Neither CUDA nor MPS is available. Using CPU...")
-            self.installed_libraries["torch"] = True
-        except Exception:
-            self.installed_libraries["torch"] = False
 
     def verify_variables(self) -> None:
         """
         Checks which environment variables are installed and fills out the self.environment_variables dictionary for the frontend to access.
         """
 
-        # Ollama URL
-        if os.environ.get("OLLAMA_URL", "") != "":
-            self.environment_variables["OLLAMA_URL"] = True
-        else:
-            self.environment_variables["OLLAMA_URL"] = False
-
-        if os.environ.get("OLLAMA_MODEL", "") != "":
-            self.environment_variables["OLLAMA_MODEL"] = True
-        else:
-            self.environment_variables["OLLAMA_MODEL"] = False
-
-        if os.environ.get("OLLAMA_EMBED_MODEL", "") != "":
-            self.environment_variables["OLLAMA_EMBED_MODEL"] = True
-        else:
-            self.environment_variables["OLLAMA_EMBED_MODEL"] = False
+        environ = os.environ
+        for variable in ENVIRONMENT_VARIABLES:
+            self.environment_variables[variable] = environ.get(variable, "") != ""
 
-        # OpenAI API Key
-        if os.environ.get("OPENAI_API_KEY", "") != "":
-            self.environment_variables["OPENAI_API_KEY"] = True
-        else:
-            self.environment_variables["OPENAI_API_KEY"] = False
-
-        if os.environ.get("OPENAI_BASE_URL", "") != "":
-            self.environment_variables["OPENAI_BASE_URL"] = True
-        else:
-            self.environment_variables["OPENAI_BASE_URL"] = False
-
-        # Cohere API Key
-        if os.environ.get("COHERE_API_KEY", "") != "":
-            self.environment_variables["COHERE_API_KEY"] = True
-        else:
-            self.environment_variables["COHERE_API_KEY"] = False
-
-        # Github Token Key
-        if os.environ.get("GITHUB_TOKEN", "") != "":
-            self.environment_variables["GITHUB_TOKEN"] = True
-        else:
-            self.environment_variables["GITHUB_TOKEN"] = False
-
-        # GitLab Token Key
-        if os.environ.get("GITLAB_TOKEN", "") != "":
-            self.environment_variables["GITLAB_TOKEN"] = True
-        else:
-            self.environment_variables["GITLAB_TOKEN"] = False
-
-        # Unstructured Token Key
-        if os.environ.get("UNSTRUCTURED_API_KEY", "") != "":
-            self.environment_variables["UNSTRUCTURED_API_KEY"] = True
-        else:
-            self.environment_variables["UNSTRUCTURED_API_KEY"] = False
-
-        # OpenAI API Type, should be set to "azure" if using Azure OpenAI
-        if os.environ.get("OPENAI_API_TYPE", "") != "":
-            self.environment_variables["OPENAI_API_TYPE"] = True
-        else:
-            self.environment_variables["OPENAI_API_TYPE"] = False
-
-        # OpenAI API Version
-        if os.environ.get("OPENAI_API_VERSION", "") != "":
-            self.environment_variables["OPENAI_API_VERSION"] = True
-        else:
-            self.environment_variables["OPENAI_API_VERSION"] = False
-
-        # GOOGLE_CLOUD_PROJECT
-        if os.environ.get("GOOGLE_CLOUD_PROJECT", "") != "":
-            self.environment_variables["GOOGLE_CLOUD_PROJECT"] = True
-        else:
-            self.environment_variables["GOOGLE_CLOUD_PROJECT"] = False
-
-        # GOOGLE_APPLICATION_CREDENTIALS
-        if os.environ.get("GOOGLE_APPLICATION_CREDENTIALS", "") != "":
-            self.environment_variables["GOOGLE_APPLICATION_CREDENTIALS"] = True
-        else:
-            self.environment_variables["GOOGLE_APPLICATION_CREDENTIALS"] = False
-
-        # Azure openai ressource name, mandatory when using Azure, should be XXX when endpoint is https://XXX.openai.azure.com
-        if os.environ.get("AZURE_OPENAI_RESOURCE_NAME", "") != "":
-            self.environment_variables["AZURE_OPENAI_RESOURCE_NAME"] = True
-        else:
-            self.environment_variables["AZURE_OPENAI_RESOURCE_NAME"] = False
-
-        # Model used for embeddings. mandatory when using Azure. Typically "text-embedding-ada-002"
-        if os.environ.get("AZURE_OPENAI_EMBEDDING_MODEL", "") != "":
-            self.environment_variables["AZURE_OPENAI_EMBEDDING_MODEL"] = True
-        else:
-            self.environment_variables["AZURE_OPENAI_EMBEDDING_MODEL"] = False
-
-        # Model used for queries. mandatory when using Azure, but can also be used to change the model used for queries when using OpenAI.
-        if os.environ.get("OPENAI_MODEL", "") != "":
-            self.environment_variables["OPENAI_MODEL"] = True
-        else:
-            self.environment_variables["OPENAI_MODEL"] = False
-
-        if os.environ.get("OPENAI_API_TYPE", "") == "azure":
-            if not (
-                self.environment_variables["OPENAI_BASE_URL"]
-                and self.environment_variables["AZURE_OPENAI_RESOURCE_NAME"]
-                and self.environment_variables["AZURE_OPENAI_EMBEDDING_MODEL"]
-                and self.environment_variables["OPENAI_MODEL"]
-            ):
-                raise EnvironmentError(
-                    "Missing environment variables. When using Azure OpenAI, you need to set OPENAI_BASE_URL, AZURE_OPENAI_RESOURCE_NAME, AZURE_OPENAI_EMBEDDING_MODEL and OPENAI_MODEL. Please check documentation."
-                )
+        if environ.get("OPENAI_API_TYPE", "") == "azure" and not all(
+            self.environment_variables[variable] for variable in AZURE_REQUIRED
+        ):
+            raise EnvironmentError(
+                "Missing environment variables. When using Azure OpenAI, you need to set OPENAI_BASE_URL, AZURE_OPENAI_RESOURCE_NAME, AZURE_OPENAI_EMBEDDING_MODEL and OPENAI_MODEL. Please check documentation."
+            )
 
     def get_schemas(self) -> dict:
         """
@@ -459,18 +581,28 @@ class VerbaManager:
         schemas = {}
 
         try:
-            for _class in schema_info["classes"]:
-                results = (
-                    self.client.query.aggregate(_class["class"]).with_meta_count().do()
+            class_names = [
+                _class["class"]
+                for _class in schema_info["classes"]
+                if "VERBA" in _class["class"]
+            ]
+            if not class_names:
+                return schemas
+
+            # One aliased Aggregate query counts all classes in a single request
+            fields = " ".join(
+                f"c{i}: {class_name} {{ meta {{ count }} }}"
+                for i, class_name in enumerate(class_names)
+            )
+            results = self.client.query.raw("{ Aggregate { " + fields + " } }")
+            aggregate = (results.get("data") or {}).get("Aggregate") or {}
+
+            for i, class_name in enumerate(class_names):
+                schemas[class_name] = (
+                    (aggregate.get(f"c{i}") or [{}])[0]
+                    .get("meta", {})
+                    .get("count", 0)
                 )
-                if "VERBA" in _class["class"]:
-                    schemas[_class["class"]] = (
-                        results.get("data", {})
-                        .get("Aggregate", {})
-                        .get(_class["class"], [{}])[0]
-                        .get("meta", {})
-                        .get("count", 0)
-                    )
         except Exception as e:
             msg.fail(f"Couldn't retrieve information about Collections, if you're using Weaviate Embedded, try to reset `~/.local/share/weaviate` ({str(e)})")
 
@@ -486,6 +618,26 @@ class VerbaManager:
         Returns:
             list[str]: List of possible autocomplete suggestions.
         """
+        if not self.suggestion_index_loaded:
+            self.load_suggestion_index()
+
+        # Prefix matches are answered from memory, BM25 is only used on a miss
+        prefix = query.lower()
+        if prefix.strip():
+            suggestions = []
+            # Flushes insert into the index under the same lock
+            with self.suggestion_lock:
+                index = self.suggestion_index
+                i = bisect.bisect_left(index, (prefix,))
+                while i < len(index) and len(suggestions) < 3:
+                    key, suggestion = index[i]
+                    if not key.startswith(prefix):
+                        break
+                    suggestions.append(suggestion)
+                    i += 1
+            if suggestions:
+                return suggestions
+
         query_results = (
             self.client.query.get(
                 class_name="VERBA_Suggestion",
@@ -501,12 +653,47 @@ class VerbaManager:
         if not results:
             return []
 
-        suggestions = []
+        return [result["suggestion"] for result in results]
 
-        for result in results:
-            suggestions.append(result["suggestion"])
+    def load_suggestion_index(self):
+        """
+        Load the stored suggestions into the in-memory autocomplete index.
+        """
+        # All suggestions are read page by page with the cursor API
+        entries = set()
+        after = None
+        page_size = 10000
+        while True:
+            query = (
+                self.client.query.get(
+                    class_name="VERBA_Suggestion",
+                    properties=["suggestion"],
+                )
+                .with_additional(properties=["id"])
+                .with_limit(page_size)
+            )
+            if after is not None:
+                query = query.with_after(after)
+            query_results = query.do()
+
+            results = query_results.get("data", {}).get("Get", {}).get(
+                "VERBA_Suggestion"
+            ) or []
+            entries.update(
+                (result["suggestion"].lower(), result["suggestion"])
+                for result in results
+                if result.get("suggestion")
+            )
+            if len(results) < page_size:
+                break
+            after = results[-1]["_additional"]["id"]
 
-        return suggestions
+        # Suggestions flushed while loading were inserted into the current
+        # index and are kept
+        with self.suggestion_lock:
+            entries.update(self.suggestion_index)
+            self.suggestion_index = sorted(entries)
+            self.suggestion_index_loaded = True
 
     def set_suggestions(self, query: str):
         """
@@ -519,6 +706,67 @@ class VerbaManager:
         production_key = os.environ.get("VERBA_PRODUCTION", "")
         if production_key == "True":
             return
+
+        # Queries are buffered and written in batches, recently seen ones are
+        # skipped without asking Weaviate
+        with self.suggestion_lock:
+            if query in self.seen_suggestions:
+                self.seen_suggestions.move_to_end(query)
+                return
+            self.seen_suggestions[query] = None
+            if len(self.seen_suggestions) > self.seen_suggestions_size:
+                self.seen_suggestions.popitem(last=False)
+            self.suggestion_buffer.append(query)
+            flush = (
+                len(self.suggestion_buffer) >= self.suggestion_batch_size
+                or time.monotonic() - self.last_suggestion_flush
+                >= self.suggestion_flush_interval
+            )
+
+        if flush:
+            self.flush_suggestions()
+        else:
+            self.schedule_suggestion_flush()
+
+    def schedule_suggestion_flush(self):
+        """
+        Start the timer that writes the buffered suggestions, unless one is already running.
+        """
+        with self.suggestion_lock:
+            if self.suggestion_timer is not None and self.suggestion_timer.is_alive():
+                return
+            self.suggestion_timer = threading.Timer(
+                self.suggestion_flush_interval,
+                _flush_suggestions_later,
+                args=(weakref.ref(self),),
+            )
+            self.suggestion_timer.daemon = True
+            self.suggestion_timer.start()
+
+    def flush_suggestions_safely(self):
+        """
+        Flush the suggestions from the timer thread, logging failures.
+        """
+        with self.suggestion_lock:
+            self.suggestion_timer = None
+        try:
+            self.flush_suggestions()
+        except Exception as e:
+            msg.warn(f"Saving suggestions failed, retrying later: {str(e)}")
+            self.schedule_suggestion_flush()
+
+    def flush_suggestions(self):
+        """
+        Write buffered suggestions that don't exist yet to the suggestion class.
+        """
+        with self.suggestion_lock:
+            pending = self.suggestion_buffer
+            self.suggestion_buffer = []
+            self.last_suggestion_flush = time.monotonic()
+
+        if not pending:
+            return
+
         check_results = (
             self.client.query.get(
                 class_name="VERBA_Suggestion",
@@ -526,33 +774,58 @@ class VerbaManager:
             )
             .with_where(
                 {
-                    "path": ["suggestion"],
-                    "operator": "Equal",
-                    "valueText": query,
+                    "operator": "Or",
+                    "operands": [
+                        {
+                            "path": ["suggestion"],
+                            "operator": "Equal",
+                            "valueText": query,
+                        }
+                        for query in pending
+                    ],
                 }
             )
-            .with_limit(1)
+            .with_limit(len(pending))
             .do()
         )
 
-        if (
-            "data" in check_results
-            and len(check_results["data"]["Get"]["VERBA_Suggestion"]) > 0
-        ):
-            if (
-                query
-                == check_results["data"]["Get"]["VERBA_Suggestion"][0]["suggestion"]
-            ):
-                return
-
-        with self.client.batch as batch:
-            batch.batch_size = 1
-            properties = {
-                "suggestion": query,
+        existing = set()
+        if "data" in check_results:
+            existing = {
+                result["suggestion"]
+                for result in check_results["data"]["Get"]["VERBA_Suggestion"]
             }
-            self.client.batch.add_data_object(properties, "VERBA_Suggestion")
 
-        msg.info("Added query to suggestions")
+        new_suggestions = [query for query in pending if query not in existing]
+        if not new_suggestions:
+            return
+
+        try:
+            with BATCH_LOCK, self.client.batch:
+                for query in new_suggestions:
+                    properties = {
+                        "suggestion": query,
+                    }
+                    self.client.batch.add_data_object(properties, "VERBA_Suggestion")
+        except Exception:
+            # Keep the suggestions for the next flush instead of dropping them
+            with self.suggestion_lock:
+                self.suggestion_buffer = new_suggestions + self.suggestion_buffer
+            raise
+
+        # The index is updated even while it is still loading, the load
+        # merges these entries instead of replacing them
+        with self.suggestion_lock:
+            for query in new_suggestions:
+                bisect.insort(self.suggestion_index, (query.lower(), query))
+
+        msg.info(f"Added {len(new_suggestions)} queries to suggestions")
+
+    def clear_suggestion_buffer(self):
+        with self.suggestion_lock:
+            self.suggestion_buffer = []
+            self.seen_suggestions.clear()
+            self.suggestion_index = []
 
     def retrieve_chunks(self, queries: list[str]) -> list[Chunk]:
         """
@@ -564,48 +837,77 @@ class VerbaManager:
         Returns:
             tuple: A tuple containing the list of retrieved chunks, context, chunk info, and first template public ID.
         """
+        return self._retrieve_chunks(queries)[:4]
+
+    def _retrieve_chunks(self, queries: list[str]) -> tuple:
+        """
+        Retrieve relevant chunks, also returning the chunk info as columns.
+
+        Args:
+            queries (list[str]): List of query strings.
+
+        Returns:
+            tuple: Chunks, context, chunk info, first template public ID and a dict with the "public_id" and "tags" columns of the chunk info.
+        """
+        embedder = self.embedder_manager.embedders[
+            self.embedder_manager.selected_embedder
+        ]
+        generator = self.generator_manager.generators[
+            self.generator_manager.selected_generator
+        ]
+        self._ensure_schema(embedder.vectorizer)
+
         chunks, context = self.retriever_manager.retrieve(
-            queries,
-            self.client,
-            self.embedder_manager.embedders[self.embedder_manager.selected_embedder],
-            self.generator_manager.generators[
-                self.generator_manager.selected_generator
-            ],
+            queries, self.client, embedder, generator
         )
         
-        print(f"Retrieved {len(chunks)} chunks")
-        
-        processed_chunks = []
+        logger.debug("Retrieved %d chunks", len(chunks))
+
+        # Chunks of the same document share one lookup
+        documents = {
+            doc_id: self.retrieve_document(doc_id)
+            for doc_id in dict.fromkeys(chunk.doc_uuid for chunk in chunks)
+        }
+
+        # Length is known upfront, fill by index instead of growing the list
+        processed_chunks = [None] * len(chunks)
+        chunk_info = [None] * len(chunks)
+        public_ids = [None] * len(chunks)
+        tags = [None] * len(chunks)
+        debug = logger.isEnabledFor(logging.DEBUG)
         for i, chunk in enumerate(chunks):
-            print(f"Chunk {i}: {chunk.to_dict()}")
-            
+            if debug:
+                logger.debug("Chunk %d: %s", i, chunk.to_dict())
+
             # Retrieve the full document data for this chunk
-            doc_id = chunk.doc_uuid
-            full_doc = self.retrieve_document(doc_id)
-            
+            full_doc = documents[chunk.doc_uuid]
+
             if full_doc:
                 doc_properties = full_doc.get("properties", {})
-                
+
                 # Update chunk with additional information
                 chunk.set_public_id(doc_properties.get("id", ""))
                 chunk.set_tags(doc_properties.get("tags", []))
-                
+
                 # Add template_images to chunk's meta
                 chunk.meta["template_images"] = doc_properties.get("template_images", [])
-            
-            processed_chunks.append(chunk)
 
-        chunk_info = [{"public_id": chunk.public_id, "tags": chunk.tags} for chunk in processed_chunks]
-        
+            processed_chunks[i] = chunk
+            chunk_info[i] = {"public_id": chunk.public_id, "tags": chunk.tags}
+            public_ids[i] = chunk.public_id
+            tags[i] = chunk.tags
+
         # Get the first template image's public_id
         first_template_public_id = ''
         if processed_chunks and processed_chunks[0].meta.get('template_images'):
             first_template_public_id = processed_chunks[0].meta['template_images'][0]
-        
-        print(f"First chunk meta: {processed_chunks[0].meta if processed_chunks else 'No chunks'}")
-        print(f"First template public_id: {first_template_public_id}")
 
-        return processed_chunks, context, chunk_info, first_template_public_id
+        if debug:
+            logger.debug("chunks: %s", orjson.dumps(chunk_info).decode())
+            logger.debug("First template public_id: %s", first_template_public_id)
+
+        columns = {"public_id": public_ids, "tags": tags}
+        return processed_chunks, context, chunk_info, first_template_public_id, columns
 
     def retrieve_all_documents(self, doc_type: str, page: int, pageSize: int) -> list:
         """
@@ -619,11 +921,7 @@ class VerbaManager:
         Returns:
             list: List of retrieved documents.
         """
-        class_name = "VERBA_Document_" + schema_manager.strip_non_letters(
-            self.embedder_manager.embedders[
-                self.embedder_manager.selected_embedder
-            ].vectorizer
-        )
+        class_name = self.doc_class_name
 
         offset = pageSize * (page - 1)
 
@@ -679,12 +977,13 @@ class VerbaManager:
                 .do()
             )
 
-        print(f"Query results: {query_results}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Query results: %s", orjson.dumps(query_results).decode())
 
         if 'data' in query_results and 'Get' in query_results['data']:
             results = query_results["data"]["Get"][class_name]
         else:
-            print(f"Unexpected query_results structure: {query_results}")
+            logger.warning("Unexpected query_results structure: %s", query_results)
             results = []
 
         return results
@@ -693,11 +992,11 @@ class VerbaManager:
         """Aggreagtes and returns all document types from Weaviate
         @returns list - Document list.
         """
-        class_name = "VERBA_Document_" + schema_manager.strip_non_letters(
-            self.embedder_manager.embedders[
-                self.embedder_manager.selected_embedder
-            ].vectorizer
-        )
+        class_name = self.doc_class_name
+
+        cached = self.document_types_cache.get(class_name)
+        if cached is not None and time.monotonic() - cached[0] < self.document_types_ttl:
+            return cached[1]
 
         query_results = (
             self.client.query.aggregate(class_name)
@@ -711,8 +1010,12 @@ class VerbaManager:
                 "doc_type"
             ]["topOccurrences"]
         ]
+        self.document_types_cache[class_name] = (time.monotonic(), results)
         return results
 
+    def clear_document_types_cache(self) -> None:
+        self.document_types_cache.clear()
+
     def retrieve_document(self, doc_id: str) -> dict:
         """
         Retrieve a document by its ID from Weaviate.
@@ -723,11 +1026,7 @@ class VerbaManager:
         Returns:
             dict: Retrieved document as a dictionary.
         """
-        class_name = "VERBA_Document_" + schema_manager.strip_non_letters(
-            self.embedder_manager.embedders[
-                self.embedder_manager.selected_embedder
-            ].vectorizer
-        )
+        class_name = self.doc_class_name
 
         document = self.client.data_object.get_by_id(
             doc_id,
@@ -750,17 +1049,16 @@ class VerbaManager:
         Returns:
             dict: Generated answer with metadata.
         """
+        embedder = self.embedder_manager.embedders[
+            self.embedder_manager.selected_embedder
+        ]
         semantic_result = None
+        joined_queries = " ".join(queries)
         if self.enable_caching:
-            semantic_query = self.embedder_manager.embedders[
-                self.embedder_manager.selected_embedder
-            ].conversation_to_query(queries, conversation)
-            (
-                semantic_result,
-                distance,
-            ) = self.embedder_manager.embedders[
-                self.embedder_manager.selected_embedder
-            ].retrieve_semantic_cache(self.client, semantic_query)
+            semantic_query = embedder.conversation_to_query(queries, conversation)
+            semantic_result, distance = await asyncio.to_thread(
+                embedder.retrieve_semantic_cache, self.client, semantic_query
+            )
 
         if semantic_result is not None:
             return {
@@ -775,26 +1073,50 @@ class VerbaManager:
                 self.generator_manager.selected_generator
             ].generate(queries, contexts, conversation)
             if self.enable_caching:
-                self.embedder_manager.embedders[
-                    self.embedder_manager.selected_embedder
-                ].add_to_semantic_cache(self.client, semantic_query, full_text)
-                self.set_suggestions(" ".join(queries))
+                # The cache and suggestion writes don't delay the end of the response
+                self._run_in_background(
+                    embedder.add_to_semantic_cache,
+                    self.client,
+                    semantic_query,
+                    full_text,
+                )
+                self._run_in_background(self.set_suggestions, joined_queries)
             return full_text
 
     async def generate_stream_answer(self, queries: list[str], contexts: list[str], conversation: dict):
-        semantic_result = None
-        chunks, context, chunk_info, first_template_public_id = self.retrieve_chunks(queries)
-
-        print(f"Retrieved chunks with public_ids: {[chunk['public_id'] for chunk in chunk_info]} and tags: {[chunk['tags'] for chunk in chunk_info]}")
-        print(f"First template public_id: {first_template_public_id}")
+        joined_queries = " ".join(queries)
+        embedder = self.embedder_manager.embedders[
+            self.embedder_manager.selected_embedder
+        ]
 
+        # The semantic cache lookup runs while the chunks are retrieved, cached
+        # answers also get their metadata from the current chunks
+        semantic_result = None
+        retrieval = asyncio.to_thread(self._retrieve_chunks, queries)
         if self.enable_caching:
-            semantic_query = self.embedder_manager.embedders[
-                self.embedder_manager.selected_embedder
-            ].conversation_to_query(queries, conversation)
-            semantic_result, distance = self.embedder_manager.embedders[
-                self.embedder_manager.selected_embedder
-            ].retrieve_semantic_cache(self.client, semantic_query)
+            semantic_query = embedder.conversation_to_query(queries, conversation)
+            retrieved, (semantic_result, distance) = await asyncio.gather(
+                retrieval,
+                asyncio.to_thread(
+                    embedder.retrieve_semantic_cache, self.client, semantic_query
+                ),
+            )
+        else:
+            retrieved = await retrieval
+        chunks, context, chunk_info, first_template_public_id, columns = retrieved
+
+        logger.debug("Retrieved chunks with chunk info: %s", chunk_info)
+        logger.debug("First template public_id: %s", first_template_public_id)
+
+        # Chunk metadata is the same for every yielded result, build it once
+        # from the chunk info columns
+        public_ids = [public_id for public_id in columns["public_id"] if public_id]
+        enrichment = {
+            "images": [{"public_id": public_id} for public_id in public_ids],
+            "public_id": public_ids,
+            "tags": [tags for tags in columns["tags"] if tags],
+            "template_public_id": first_template_public_id,
+        }
 
         if semantic_result is not None:
             yield {
@@ -802,60 +1124,137 @@ class VerbaManager:
                 "finish_reason": "stop",
                 "cached": True,
                 "distance": distance,
-                "images": [{"public_id": chunk["public_id"]} for chunk in chunk_info if chunk["public_id"]],
-                "public_id": [chunk["public_id"] for chunk in chunk_info if chunk["public_id"]],
-                "tags": [chunk["tags"] for chunk in chunk_info if chunk["tags"]],
-                "template_public_id": first_template_public_id
+                **enrichment,
             }
         else:
-            full_text = ""
+            parts = []
             generator = self.generator_manager.generators[self.generator_manager.selected_generator]
-            
-            if isinstance(generator, VideoEditingGenerator):
-                # Handle VideoEditingGenerator separately
-                try:
-                    result = await generator.generate(queries, [context], conversation)
-                    yield {
-                        "message": result,
-                        "finish_reason": "stop",
-                        "images": [{"public_id": chunk["public_id"]} for chunk in chunk_info if chunk["public_id"]],
-                        "public_id": [chunk["public_id"] for chunk in chunk_info if chunk["public_id"]],
-                        "tags": [chunk["tags"] for chunk in chunk_info if chunk["tags"]],
-                        "template_public_id": first_template_public_id
-                    }
-                except Exception as e:
-                    yield {
-                        "message": f"Error in VideoEditingGenerator: {str(e)}",
-                        "finish_reason": "error",
-                        "error": str(e)
-                    }
+
+            # Generators declare whether they stream tokens or answer at once
+            stream = self.stream_handlers[generator.streamable]
+            failed = False
+            async for result in stream(
+                generator, queries, context, conversation, enrichment, parts
+            ):
+                failed = failed or result["finish_reason"] == "error"
+                yield result
+            full_text = "".join(parts)
+
+            # A failed generation is not cached as an answer
+            if self.enable_caching and not failed:
+                # The cache and suggestion writes don't delay the end of the response
+                self._run_in_background(
+                    embedder.add_to_semantic_cache,
+                    self.client,
+                    semantic_query,
+                    full_text,
+                )
+                self._run_in_background(self.set_suggestions, joined_queries)
+
+    async def _stream_complete(
+        self,
+        generator: Generator,
+        queries: list[str],
+        context: str,
+        conversation: dict,
+        enrichment: dict,
+        parts: list[str],
+    ):
+        """
+        Yield the answer of a generator that doesn't stream as a single result.
+
+        Args:
+            generator (Generator): Selected generator.
+            queries (list[str]): List of query strings.
+            context (str): Retrieved context.
+            conversation (dict): Conversation history.
+            enrichment (dict): Chunk metadata added to the result.
+            parts (list[str]): Collects the answer for the semantic cache.
+        """
+        try:
+            result = await generator.generate(queries, [context], conversation)
+            parts.append(result)
+            yield {
+                "message": result,
+                "finish_reason": "stop",
+                **enrichment,
+            }
+        except Exception as e:
+            yield {
+                "message": f"Error in {generator.name}: {str(e)}",
+                "finish_reason": "error",
+                "error": str(e)
+            }
+
+    async def _stream_tokens(
+        self,
+        generator: Generator,
+        queries: list[str],
+        context: str,
+        conversation: dict,
+        enrichment: dict,
+        parts: list[str],
+    ):
+        """
+        Yield the token results of a streaming generator.
+
+        Args:
+            generator (Generator): Selected generator.
+            queries (list[str]): List of query strings.
+            context (str): Retrieved context.
+            conversation (dict): Conversation history.
+            enrichment (dict): Chunk metadata added to every result.
+            parts (list[str]): Collects the streamed text for the semantic cache.
+        """
+        # The metadata doesn't change per token, serialize it for the log once
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            enrichment_log = orjson.dumps(enrichment).decode()
+            if len(enrichment_log) > 700:
+                enrichment_log = enrichment_log[:700] + "..."
+
+        # The generator keeps producing into a bounded queue while the
+        # caller is still sending earlier results
+        queue = asyncio.Queue(maxsize=16)
+        finished = object()
+
+        async def produce():
+            results = generator.generate_stream(queries, [context], conversation)
+            try:
+                async for result in results:
+                    result |= enrichment
+                    await queue.put(result)
+            except Exception as e:
+                await queue.put(e)
             else:
-                # Handle other generators
-                try:
-                    async for result in generator.generate_stream(queries, [context], conversation):
-                        full_text += result["message"]
-                        result.update({
-                            "images": [{"public_id": chunk["public_id"]} for chunk in chunk_info if chunk["public_id"]],
-                            "public_id": [chunk["public_id"] for chunk in chunk_info if chunk["public_id"]],
-                            "tags": [chunk["tags"] for chunk in chunk_info if chunk["tags"]],
-                            "template_public_id": first_template_public_id
-                        })
-                        print(f"Yielding chunk with public_ids: {result['public_id']}, tags: {result['tags']}, and template_public_id: {result['template_public_id']}")
-                        yield result
-                except Exception as e:
+                await queue.put(finished)
+            finally:
+                # Closes the upstream stream right away when the consumer
+                # goes away instead of leaving it to the finalizer
+                await results.aclose()
+
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                result = await queue.get()
+                if result is finished:
+                    break
+                if isinstance(result, Exception):
                     yield {
-                        "message": f"Error in generator: {str(e)}",
+                        "message": f"Error in generator: {str(result)}",
                         "finish_reason": "error",
-                        "error": str(e)
+                        "error": str(result)
                     }
+                    break
+                parts.append(result["message"])
+                if debug:
+                    logger.debug("Yielding chunk with %s", enrichment_log)
+                yield result
+        finally:
+            producer.cancel()
+            # Waits for the producer to close the generator's stream
+            await asyncio.gather(producer, return_exceptions=True)
 
-            if self.enable_caching:
-                self.set_suggestions(" ".join(queries))
-                self.embedder_manager.embedders[
-                    self.embedder_manager.selected_embedder
-                ].add_to_semantic_cache(self.client, semantic_query, full_text)
-                self.set_suggestions(" ".join(queries))
-                
     def debug_print_document(self, doc_name):
         """
         Print debug information for a document.
@@ -863,11 +1262,7 @@ class VerbaManager:
         Args:
             doc_name (str): Name of the document to debug.
         """
-        class_name = "VERBA_Document_" + schema_manager.strip_non_letters(
-            self.embedder_manager.embedders[
-                self.embedder_manager.selected_embedder
-            ].vectorizer
-        )
+        class_name = self.doc_class_name
         
         result = (
             self.client.query.get(class_name, ["doc_name", "text", "tags", "example_images", "template_images"])
@@ -880,60 +1275,54 @@ class VerbaManager:
         )
     
         print(f"Debug: Document data for {doc_name}")
-        print(json.dumps(result, indent=2))
+        print(orjson.dumps(result).decode())
 
     def reset(self):
+        self.clear_document_types_cache()
+        self.clear_suggestion_buffer()
         self.client.schema.delete_class("VERBA_Suggestion")
-        # Check if all schemas exist for all possible vectorizers
-        for vectorizer in schema_manager.VECTORIZERS:
-            schema_manager.reset_schemas(self.client, vectorizer)
-
-        for embedding in schema_manager.EMBEDDINGS:
-            schema_manager.reset_schemas(self.client, embedding)
+        self._drop_classes(("document", "chunk", "cache"))
+        self._reinit_all_schemas()
 
-        for vectorizer in schema_manager.VECTORIZERS:
-            schema_manager.init_schemas(self.client, vectorizer, False, True)
+    def reset_documents(self):
+        self.clear_document_types_cache()
+        self._drop_classes(("document", "chunk"))
+        self._reinit_all_schemas()
 
-        for embedding in schema_manager.EMBEDDINGS:
-            schema_manager.init_schemas(self.client, embedding, False, True)
+    def reset_cache(self):
+        self._drop_classes(("cache",))
+        self._reinit_all_schemas()
 
-    def reset_documents(self):
-        # Check if all schemas exist for all possible vectorizers
-        for vectorizer in schema_manager.VECTORIZERS:
-            document_class_name = "VERBA_Document_" + schema_manager.strip_non_letters(
-                vectorizer
-            )
-            chunk_class_name = "VERBA_Chunk_" + schema_manager.strip_non_letters(
-                vectorizer
-            )
-            self.client.schema.delete_class(document_class_name)
-            self.client.schema.delete_class(chunk_class_name)
-            schema_manager.init_schemas(self.client, vectorizer, False, True)
+    def _iter_all_backends(self):
+        """
+        Yield the class names of every vectorizer.
 
-        for embedding in schema_manager.EMBEDDINGS:
-            document_class_name = "VERBA_Document_" + schema_manager.strip_non_letters(
-                embedding
-            )
-            chunk_class_name = "VERBA_Chunk_" + schema_manager.strip_non_letters(
-                embedding
-            )
-            self.client.schema.delete_class(document_class_name)
-            self.client.schema.delete_class(chunk_class_name)
-            schema_manager.init_schemas(self.client, embedding, False, True)
+        Returns:
+            Iterator[dict[str, str]]: Document, chunk and cache class names by kind.
+        """
+        for vectorizer in sorted(schema_manager.VECTORIZERS | schema_manager.EMBEDDINGS):
+            suffix = schema_manager.strip_non_letters(vectorizer)
+            yield {
+                "document": "VERBA_Document_" + suffix,
+                "chunk": "VERBA_Chunk_" + suffix,
+                "cache": "VERBA_Cache_" + suffix,
+            }
 
-    def reset_cache(self):
-        # Check if all schemas exist for all possible vectorizers
-        for vectorizer in schema_manager.VECTORIZERS:
-            class_name = "VERBA_Cache_" + schema_manager.strip_non_letters(vectorizer)
-            self.client.schema.delete_class(class_name)
-            schema_manager.init_schemas(self.client, vectorizer, False, True)
+    def _drop_classes(self, kinds: tuple[str, ...]) -> None:
+        """
+        Delete the given kinds of classes for every vectorizer concurrently.
 
-        for embedding in schema_manager.EMBEDDINGS:
-            class_name = "VERBA_Cache_" + schema_manager.strip_non_letters(embedding)
-            self.client.schema.delete_class(class_name)
-            schema_manager.init_schemas(self.client, embedding, False, True)
+        Args:
+            kinds (tuple[str, ...]): Any of "document", "chunk" and "cache".
+        """
+        class_names = [
+            backend[kind] for backend in self._iter_all_backends() for kind in kinds
+        ]
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(self.client.schema.delete_class, class_names))
 
     def reset_suggestion(self):
+        self.clear_suggestion_buffer()
         self.client.schema.delete_class("VERBA_Suggestion")
         schema_manager.init_suggestion(self.client, "", False, True)
 
@@ -946,38 +1335,93 @@ class VerbaManager:
         @parameter document : Document - Document object
         @returns bool - Whether the doc name exist in the cluster.
         """
-        class_name = "VERBA_Document_" + schema_manager.strip_non_letters(
-            self.embedder_manager.embedders[
-                self.embedder_manager.selected_embedder
-            ].vectorizer
-        )
+        return self.check_if_documents_exist([document])[document.name]
 
-        results = (
-            self.client.query.get(
-                class_name=class_name,
-                properties=[
-                    "doc_name",
-                ],
-            )
-            .with_where(
-                {
-                    "path": ["doc_name"],
-                    "operator": "Equal",
-                    "valueText": document.name,
-                }
-            )
-            .with_limit(1)
-            .do()
-        )
+    def check_if_documents_exist(self, documents: list[Document]) -> dict[str, bool]:
+        """
+        Check which documents already exist in Weaviate with batched queries.
 
-        if "data" in results:
-            if results["data"]["Get"][class_name]:
-                msg.warn(f"{document.name} already exists")
-                return True
-        else:
-            msg.warn(f"Error occured while checking for duplicates: {results}")
-        
-        return False
+        Args:
+            documents (list[Document]): Documents to check.
+
+        Returns:
+            dict[str, bool]: Whether each document name exists in the cluster.
+        """
+        names = [document.name for document in documents]
+        existing_names = self.get_existing_document_names(names)
+        for name in existing_names:
+            msg.warn(f"{name} already exists")
+        return {name: name in existing_names for name in names}
+
+    def get_existing_document_names(
+        self, names: list[str], batch_size: int = 100
+    ) -> set[str]:
+        """
+        Look up which document names already exist in Weaviate.
+
+        Args:
+            names (list[str]): Document names to check.
+            batch_size (int): Number of names per Or-filter query.
+
+        Returns:
+            set[str]: The subset of names that already exist.
+        """
+        class_name = self.doc_class_name
+
+        unique_names = list(dict.fromkeys(names))
+        existing_names = set()
+
+        # Equal on doc_name matches by token, so other documents sharing
+        # words with a name are returned too. Pages are read until the
+        # results are exhausted and only exact names count.
+        for i in range(0, len(unique_names), batch_size):
+            batch = unique_names[i : i + batch_size]
+            batch_names = set(batch)
+            page_size = max(len(batch) * 10, 100)
+            offset = 0
+
+            # The filter stays the same for every page of a batch, the
+            # paging only stops early once every name is found
+            while not batch_names <= existing_names:
+                results = (
+                    self.client.query.get(
+                        class_name=class_name,
+                        properties=[
+                            "doc_name",
+                        ],
+                    )
+                    .with_where(
+                        {
+                            "operator": "Or",
+                            "operands": [
+                                {
+                                    "path": ["doc_name"],
+                                    "operator": "Equal",
+                                    "valueText": name,
+                                }
+                                for name in batch
+                            ],
+                        }
+                    )
+                    .with_limit(page_size)
+                    .with_offset(offset)
+                    .do()
+                )
+                if "data" not in results:
+                    msg.warn(f"Error occured while checking for duplicates: {results}")
+                    break
+
+                page = results["data"]["Get"][class_name]
+                existing_names.update(
+                    result["doc_name"]
+                    for result in page
+                    if result["doc_name"] in batch_names
+                )
+                if len(page) < page_size:
+                    break
+                offset += page_size
+
+        return existing_names
 
     def check_verba_component(self, component: VerbaComponent) -> tuple[bool, str]:
         """
@@ -1004,6 +1448,17 @@ class VerbaManager:
             self.embedder_manager.selected_embedder
         ].remove_document_by_id(self.client, doc_id)
 
+    def delete_documents_by_ids(self, doc_ids: list[str]) -> None:
+        """
+        Delete several documents and their chunks from Weaviate at once.
+
+        Args:
+            doc_ids (list[str]): IDs of the documents to delete.
+        """
+        self.embedder_manager.embedders[
+            self.embedder_manager.selected_embedder
+        ].remove_documents_by_ids(self.client, doc_ids)
+
     def search_documents(
         self, query: str, doc_type: str, page: int, pageSize: int
     ) -> list: